@@ -6,44 +6,36 @@ Strategic Project Management & Operations Portfolio Project
 Designed to showcase PM and Strategy/Operations capabilities.
 """
 
+import glob
+
 import streamlit as st
-import pandas as pd
-import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
-from datetime import datetime, timedelta
 
 # Import utility modules
 from utils.data_processing import (
-    load_all_data, get_current_sprint, calculate_rolling_metrics,
-    calculate_story_type_distribution, get_completed_stories,
-    calculate_team_member_metrics, get_initiative_summary,
-    get_sprint_summary_stats
+    load_all_data, load_table_cache, save_table_cache, data_fingerprint, DATA_FILES,
+    get_current_sprint, index_sprints_by_number,
+    calculate_rolling_metrics, calculate_story_type_distribution,
+    get_completed_stories, group_stories_by_sprint, build_sprint_summary_table
 )
 from utils.metrics import (
-    calculate_sprint_health_score, calculate_velocity_trend,
-    calculate_cycle_time_metrics, calculate_blocker_impact,
-    calculate_team_velocity_contribution, identify_bottlenecks,
-    calculate_quality_trend, calculate_work_distribution_by_role
+    calculate_sprint_health_score, calculate_team_velocity_contribution,
+    calculate_member_utilization_by_sprint, calculate_velocity_summary
 )
 from utils.prioritization import (
     add_priority_scores, add_quadrant_classification,
-    get_portfolio_composition, get_quick_wins, get_time_sinks,
-    calculate_portfolio_health_score, generate_portfolio_recommendations,
-    create_intake_funnel_data
+    get_portfolio_composition, get_quick_wins, get_time_sinks
 )
 from utils.predictive_models import (
-    predict_sprint_completion_probability, assess_all_initiatives_risk,
-    forecast_velocity_next_n_sprints, generate_predictive_recommendations,
-    calculate_probability_distribution_chart_data
+    assess_all_initiatives_risk, forecast_velocity_next_n_sprints
 )
 from utils.visualizations import (
-    create_velocity_trend_chart, create_burndown_chart,
-    create_impact_effort_matrix, create_health_gauge,
-    create_capacity_heatmap, create_cycle_time_boxplot,
-    create_story_type_stacked_area, create_completion_probability_chart,
-    create_initiative_funnel, create_treemap, create_roi_scatter,
-    create_portfolio_quadrant_summary, COLORS
+    create_velocity_trend_chart, create_impact_effort_matrix,
+    create_health_gauge, create_capacity_heatmap, create_cycle_time_boxplot,
+    create_story_type_stacked_area, create_roi_scatter,
+    create_portfolio_quadrant_summary, create_count_pie,
+    create_initiative_status_bar, create_portfolio_composition_bar,
+    create_velocity_contribution_bar, create_velocity_stability_chart,
+    create_velocity_forecast_chart, STORY_TYPE_COLORS, RISK_COLORS
 )
 
 # Page config
@@ -55,385 +47,133 @@ st.set_page_config(
 )
 
 # Custom CSS - Executive Presentation Style with Tabs
-st.markdown("""
-<style>
-    /* Import professional font */
-    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700;800&display=swap');
-
-    * {
-        font-family: 'Inter', sans-serif !important;
-    }
-
-    /* Hide default Streamlit elements */
-    #MainMenu {visibility: hidden;}
-    footer {visibility: hidden;}
-    header {visibility: hidden;}
-
-    /* Remove padding */
-    .block-container {
-        padding-top: 1rem !important;
-        padding-bottom: 0rem !important;
-        max-width: 100% !important;
-    }
-
-    /* Tab styling */
-    .stTabs [data-baseweb="tab-list"] {
-        gap: 12px;
-        background: linear-gradient(90deg, #2e7d9e 0%, #3b9fc7 100%);
-        padding: 15px 20px;
-        border-radius: 8px 8px 0 0;
-        margin-top: 10px;
-        display: flex;
-        justify-content: space-between;
-    }
-
-    .stTabs [data-baseweb="tab"] {
-        background: rgba(255, 255, 255, 0.2);
-        color: white;
-        border-radius: 6px;
-        padding: 12px 24px;
-        font-weight: 600;
-        font-size: 1rem;
-        border: 2px solid transparent;
-        flex: 1;
-        text-align: center;
-    }
-
-    .stTabs [data-baseweb="tab"]:hover {
-        background: rgba(255, 255, 255, 0.3);
-    }
-
-    .stTabs [aria-selected="true"] {
-        background: white !important;
-        color: #2e7d9e !important;
-        border: 2px solid #2e7d9e !important;
-        font-weight: 700;
-    }
-
-    /* Left sidebar styling */
-    .sidebar-content {
-        background: linear-gradient(135deg, #d4e6f1 0%, #aed6f1 100%);
-        padding: 25px;
-        border-radius: 10px;
-        margin-bottom: 15px;
-        box-shadow: 0 2px 8px rgba(0,0,0,0.1);
-    }
-
-    .sidebar-header {
-        background: #5d3a9b;
-        color: white;
-        padding: 12px 15px;
-        border-radius: 6px;
-        font-weight: 700;
-        font-size: 0.9rem;
-        text-align: center;
-        margin-bottom: 15px;
-        letter-spacing: 0.5px;
-    }
-
-    .sidebar-header-teal {
-        background: #00a896;
-        color: white;
-        padding: 12px 15px;
-        border-radius: 6px;
-        font-weight: 700;
-        font-size: 0.9rem;
-        text-align: center;
-        margin-bottom: 15px;
-        letter-spacing: 0.5px;
-    }
-
-    .sidebar-text {
-        font-size: 0.85rem;
-        line-height: 1.6;
-        color: #1a1a1a;
-        margin-bottom: 10px;
-    }
-
-    .sidebar-bullet {
-        margin-left: 15px;
-        margin-bottom: 8px;
-        font-size: 0.8rem;
-        line-height: 1.5;
-    }
-
-    /* Main header */
-    .main-title {
-        font-size: 2.5rem;
-        font-weight: 800;
-        color: #1a1a1a;
-        text-align: center;
-        margin: 0;
-        padding: 20px 0 5px 0;
-    }
-
-    .main-subtitle {
-        font-size: 1.1rem;
-        color: #666;
-        text-align: center;
-        margin: 0;
-        padding: 0 0 10px 0;
-        font-style: italic;
-    }
-
-    /* KPI metric cards */
-    .kpi-card {
-        background: white;
-        border: 2px solid #e2e8f0;
-        border-radius: 8px;
-        padding: 15px 10px;
-        text-align: center;
-        box-shadow: 0 2px 6px rgba(0,0,0,0.08);
-        height: 120px;
-        display: flex;
-        flex-direction: column;
-        justify-content: center;
-    }
-
-    .kpi-value {
-        font-size: 1.9rem;
-        font-weight: 800;
-        color: #2e7d9e;
-        margin: 3px 0;
-        line-height: 1.1;
-    }
-
-    .kpi-label {
-        font-size: 0.7rem;
-        color: #666;
-        font-weight: 600;
-        text-transform: uppercase;
-        letter-spacing: 0.3px;
-        line-height: 1.2;
-    }
-
-    .kpi-sublabel {
-        font-size: 0.65rem;
-        color: #999;
-        margin-top: 2px;
-    }
-
-    /* Section headers */
-    .section-title {
-        font-size: 1.2rem;
-        font-weight: 700;
-        color: #2d3748;
-        margin: 15px 0 10px 0;
-        padding-bottom: 6px;
-        border-bottom: 3px solid #2e7d9e;
-    }
-
-    /* Recommendation boxes */
-    .recommendation-box {
-        background: white;
-        border-left: 5px solid #3b82f6;
-        padding: 12px 18px;
-        margin: 10px 0;
-        border-radius: 5px;
-        box-shadow: 0 2px 5px rgba(0,0,0,0.08);
-        font-size: 0.9rem;
-        line-height: 1.5;
-    }
-
-    .recommendation-box-green {
-        border-left-color: #10b981;
-        background: #f0fdf4;
-    }
-
-    .recommendation-box-orange {
-        border-left-color: #f59e0b;
-        background: #fffbeb;
-    }
-
-    .recommendation-box-red {
-        border-left-color: #ef4444;
-        background: #fef2f2;
-    }
-
-    /* Yellow results box */
-    .results-box {
-        background: linear-gradient(135deg, #fff4b3 0%, #ffe680 100%);
-        border: 3px solid #f59e0b;
-        border-radius: 10px;
-        padding: 20px;
-        margin: 25px 0;
-        box-shadow: 0 4px 12px rgba(0,0,0,0.1);
-    }
+@st.cache_data
+def load_css(path='assets/styles.css'):
+    """Read the dashboard stylesheet once per process"""
+    with open(path) as f:
+        return f.read()
 
-    .results-title {
-        font-size: 1.3rem;
-        font-weight: 800;
-        color: #1a1a1a;
-        text-align: center;
-        margin-bottom: 15px;
-        text-transform: uppercase;
-        letter-spacing: 1px;
-    }
+st.markdown(f"<style>{load_css()}</style>", unsafe_allow_html=True)
 
-    .results-text {
-        font-size: 0.95rem;
-        line-height: 1.7;
-        color: #1a1a1a;
-        font-weight: 500;
-    }
+# Load data
+# Changes to any of these invalidate the on-disk copy of the prepared tables
+CACHE_DEPENDENCIES = [*DATA_FILES.values(), __file__, *glob.glob('utils/*.py')]
 
-    /* Footer bar */
-    .footer-bar {
-        background: linear-gradient(90deg, #5d3a9b 0%, #7c5aae 100%);
-        color: white;
-        padding: 15px 25px;
-        border-radius: 8px;
-        margin: 30px 0 10px 0;
-        text-align: center;
-        font-size: 1rem;
-        font-weight: 700;
-        box-shadow: 0 3px 10px rgba(0,0,0,0.15);
-    }
+# cache_resource hands back the same objects on every rerun instead of
+# unpickling a fresh copy; the DataFrames are treated as read-only below.
+@st.cache_resource
+def load_data():
+    """Load and prepare all data"""
+    data = load_table_cache(CACHE_DEPENDENCIES)
+
+    if data is None:
+        data = load_all_data()
+        data['sprints'] = calculate_rolling_metrics(data['sprints'])
+        data['initiatives'] = add_priority_scores(data['initiatives'])
+        data['initiatives'] = add_quadrant_classification(data['initiatives'])
+        save_table_cache(data)
+
+    # Cheap cache key for the cache_data wrappers below
+    data['fingerprint'] = data_fingerprint(data)
+
+    # Current sprint info
+    data['current_sprint'] = get_current_sprint(data['sprints'])
+    data['current_sprint_num'] = int(data['current_sprint']['sprint_number'])
+    data['sprints_by_number'] = index_sprints_by_number(data['sprints'])
+
+    # Stories per sprint, and completed stories overall and per sprint
+    data['stories_by_sprint'] = group_stories_by_sprint(data['stories'])
+    data['completed_stories'] = get_completed_stories(data['stories'])
+    data['completed_stories_by_sprint'] = group_stories_by_sprint(data['completed_stories'])
+
+    # Initiative status counts and the completed initiatives themselves
+    data['initiative_status_counts'] = data['initiatives']['status'].value_counts()
+    data['completed_initiatives'] = data['initiatives'][data['initiatives']['status'] == 'Completed']
+
+    # Data Overview sprint table
+    data['sprint_summary'] = build_sprint_summary_table(data['sprints'])
+    return data
 
-    .target-role {
-        font-size: 0.95rem;
-        color: #666;
-        text-align: center;
-        margin: 10px 0;
-        font-style: italic;
-    }
+try:
+    data = load_data()
+    sprints_df = data['sprints']
+    stories_df = data['stories']
+    initiatives_df = data['initiatives']
+    team_df = data['team']
+    current_sprint = data['current_sprint']
+    current_sprint_num = data['current_sprint_num']
+    fingerprint = data['fingerprint']
+except Exception as e:
+    st.error(f"Error loading data: {e}")
+    st.info("Please run: `python data/generate_data.py` to generate sample data.")
+    st.stop()
 
-    /* Contact info */
-    .contact-info {
-        font-size: 0.75rem;
-        color: #1a1a1a;
-        text-align: center;
-        margin-top: 15px;
-        line-height: 1.5;
-        font-weight: 500;
-    }
 
-    /* Contact buttons */
-    .contact-button {
-        display: inline-block;
-        background: linear-gradient(135deg, #2e7d9e 0%, #3b9fc7 100%);
-        color: white;
-        padding: 10px 20px;
-        border-radius: 6px;
-        text-decoration: none;
-        font-weight: 600;
-        font-size: 0.85rem;
-        margin: 12px 5px 0 5px;
-        transition: transform 0.2s, box-shadow 0.2s;
-        box-shadow: 0 2px 5px rgba(0,0,0,0.15);
-    }
+def compute_dashboard_kpis(data):
+    """Derive the scalar KPIs and portfolio lists shared across tabs"""
+    sprints_df = data['sprints']
+    initiatives_df = data['initiatives']
 
-    .contact-button:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 4px 8px rgba(0,0,0,0.25);
-        text-decoration: none;
-        color: white;
-    }
+    velocity = calculate_velocity_summary(sprints_df)
+    quick_wins = get_quick_wins(initiatives_df)
 
-    .linkedin-button {
-        display: inline-block;
-        background: linear-gradient(135deg, #0077B5 0%, #00A0DC 100%);
-        color: white;
-        padding: 10px 20px;
-        border-radius: 6px;
-        text-decoration: none;
-        font-weight: 600;
-        font-size: 0.85rem;
-        margin: 12px 5px 0 5px;
-        transition: transform 0.2s, box-shadow 0.2s;
-        box-shadow: 0 2px 5px rgba(0,0,0,0.15);
+    return {
+        'avg_velocity': velocity['mean'],
+        'early_velocity': velocity['early'],
+        'late_velocity': velocity['late'],
+        'velocity_change': velocity['change_pct'],
+        'predictability': velocity['predictability'],
+        'total_delivered': sprints_df['completed_points'].sum(),
+        'completed_initiatives': int(data['initiative_status_counts'].get('Completed', 0)),
+        'quick_wins': quick_wins,
+        'quick_wins_backlog': quick_wins[quick_wins['status'] == 'Backlog'],
+        'time_sinks': get_time_sinks(initiatives_df),
+        'composition': get_portfolio_composition(initiatives_df)
     }
 
-    .linkedin-button:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 4px 8px rgba(0,0,0,0.25);
-        text-decoration: none;
-        color: white;
-    }
 
-    .github-button {
-        display: inline-block;
-        background: linear-gradient(135deg, #24292e 0%, #444d56 100%);
-        color: white;
-        padding: 10px 20px;
-        border-radius: 6px;
-        text-decoration: none;
-        font-weight: 600;
-        font-size: 0.85rem;
-        margin: 12px 5px 0 5px;
-        transition: transform 0.2s, box-shadow 0.2s;
-        box-shadow: 0 2px 5px rgba(0,0,0,0.15);
-    }
+def memoize_in_session(key, data, compute):
+    """
+    Return compute(data), reusing the result stored in st.session_state
+    until load_data() hands back a different data object (cache cleared).
+    """
+    entry = st.session_state.get(key)
+    if entry is None or entry[0] is not data:
+        entry = (data, compute(data))
+        st.session_state[key] = entry
+    return entry[1]
 
-    .github-button:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 4px 8px rgba(0,0,0,0.25);
-        text-decoration: none;
-        color: white;
-    }
 
-    /* Streamlit metric overrides */
-    [data-testid="stMetricValue"] {
-        font-size: 2rem !important;
-        font-weight: 800 !important;
-        color: #2e7d9e !important;
-    }
+kpis = memoize_in_session('dashboard_kpis', data, compute_dashboard_kpis)
 
-    [data-testid="stMetricLabel"] {
-        font-size: 0.8rem !important;
-        color: #666 !important;
-        font-weight: 600 !important;
-    }
 
-    /* Table styling */
-    .dataframe {
-        font-size: 0.85rem;
-    }
+# Cross-session caches keyed by the data fingerprint; Streamlit skips hashing
+# the underscore-prefixed DataFrame arguments.
+@st.cache_data(show_spinner=False)
+def cached_sprint_health_score(fingerprint, _current_sprint, _sprints_df):
+    """calculate_sprint_health_score, cached per data set"""
+    return calculate_sprint_health_score(_current_sprint, _sprints_df)
 
-    h2, h3 {
-        color: #2d3748 !important;
-    }
-</style>
-""", unsafe_allow_html=True)
 
-# Load data
-@st.cache_data
-def load_data():
-    """Load and prepare all data"""
-    data = load_all_data()
-    data['sprints'] = calculate_rolling_metrics(data['sprints'])
-    data['initiatives'] = add_priority_scores(data['initiatives'])
-    data['initiatives'] = add_quadrant_classification(data['initiatives'])
-    return data
+@st.cache_data(show_spinner=False)
+def cached_initiatives_risk(fingerprint, current_sprint_num, team_utilization, _initiatives_df, _sprints_df):
+    """assess_all_initiatives_risk, cached per data set"""
+    return assess_all_initiatives_risk(_initiatives_df, current_sprint_num, _sprints_df, team_utilization)
 
-try:
-    data = load_data()
-    sprints_df = data['sprints']
-    stories_df = data['stories']
-    initiatives_df = data['initiatives']
-    team_df = data['team']
-except Exception as e:
-    st.error(f"Error loading data: {e}")
-    st.info("Please run: `python data/generate_data.py` to generate sample data.")
-    st.stop()
 
-# Get current sprint info
-current_sprint = get_current_sprint(sprints_df)
-current_sprint_num = int(current_sprint['sprint_number'])
+@st.cache_data(show_spinner=False)
+def cached_story_type_distribution(fingerprint, _stories_df):
+    """calculate_story_type_distribution, cached per data set"""
+    return calculate_story_type_distribution(_stories_df)
 
-# ============================================================================
-# LAYOUT: 2-COLUMN (SIDEBAR + MAIN CONTENT)
-# ============================================================================
 
-# Create main layout
-sidebar_col, main_col = st.columns([1, 3])
+@st.cache_data(show_spinner=False)
+def cached_member_utilization(fingerprint, _stories_df, _sprints_df, _team_df):
+    """calculate_member_utilization_by_sprint, cached per data set"""
+    return calculate_member_utilization_by_sprint(_stories_df, _sprints_df, _team_df)
 
-# ============================================================================
-# LEFT SIDEBAR - PROJECT OVERVIEW (PERSISTENT ACROSS TABS)
-# ============================================================================
-with sidebar_col:
-    # PROJECT OVERVIEW
-    st.markdown("""
+# Static sidebar content, sent to the browser as a single element
+SIDEBAR_HTML = """
     <div class="sidebar-content">
         <div style="background: #2e7d9e; color: white; padding: 12px; border-radius: 6px; font-weight: 700; text-align: center; margin-bottom: 15px; font-size: 0.9rem;">
             PROJECT OVERVIEW
@@ -452,10 +192,7 @@ with sidebar_col:
             </div>
         </div>
     </div>
-    """, unsafe_allow_html=True)
 
-    # SKILLS DEMONSTRATED
-    st.markdown("""
     <div class="sidebar-content">
         <div class="sidebar-header">
             SKILLS DEMONSTRATED
@@ -470,10 +207,7 @@ with sidebar_col:
             </div>
         </div>
     </div>
-    """, unsafe_allow_html=True)
 
-    # BUSINESS IMPACT
-    st.markdown("""
     <div class="sidebar-content">
         <div class="sidebar-header-teal">
             BUSINESS IMPACT
@@ -489,10 +223,7 @@ with sidebar_col:
             75%+ effort on high-ROI initiatives
         </div>
     </div>
-    """, unsafe_allow_html=True)
 
-    # TECHNICAL CAPABILITIES
-    st.markdown("""
     <div class="sidebar-content">
         <div class="sidebar-text">
             <strong>Technical Stack:</strong><br>
@@ -505,10 +236,7 @@ with sidebar_col:
             </div>
         </div>
     </div>
-    """, unsafe_allow_html=True)
 
-    # CONTACT INFO
-    st.markdown("""
     <div class="contact-info">
         <strong>Portfolio Project by: </strong><br>
         <strong>Dolly Dang</strong><br>
@@ -524,7 +252,131 @@ with sidebar_col:
             🐙 GitHub
         </a>
     </div>
-    """, unsafe_allow_html=True)
+"""
+
+# KPI cards are rendered a whole row at a time as one markdown element
+KPI_ROW_TEMPLATE = '<div class="kpi-row">{cards}</div>'
+KPI_CARD_TEMPLATE = (
+    '<div class="kpi-card">'
+    '<div class="kpi-value">{value}</div>'
+    '<div class="kpi-label">{label}</div>'
+    '<div class="kpi-sublabel">{sublabel}</div>'
+    '</div>'
+)
+
+
+def render_kpi_row(cards):
+    """Render a row of KPI cards given (value, label, sublabel) tuples"""
+    html = KPI_ROW_TEMPLATE.format(cards=''.join(
+        KPI_CARD_TEMPLATE.format(value=value, label=label, sublabel=sublabel)
+        for value, label, sublabel in cards
+    ))
+    st.markdown(html, unsafe_allow_html=True)
+
+
+# Recommendation boxes are likewise rendered a column at a time
+RECOMMENDATION_LIST_TEMPLATE = '<div class="recommendation-list">{boxes}</div>'
+RECOMMENDATION_TEMPLATE = (
+    '<div class="recommendation-box recommendation-box-{tone}">'
+    '<strong>{title}</strong> {text}'
+    '</div>'
+)
+
+
+def render_recommendations(recommendations):
+    """Render a column of recommendation boxes given (tone, title, text) tuples"""
+    html = RECOMMENDATION_LIST_TEMPLATE.format(boxes=''.join(
+        RECOMMENDATION_TEMPLATE.format(tone=tone, title=title, text=text)
+        for tone, title, text in recommendations
+    ))
+    st.markdown(html, unsafe_allow_html=True)
+
+
+def initiative_recommendations(initiatives, tone):
+    """Build recommendation tuples for each initiative row, one pass over its columns"""
+    return [
+        (tone, name,
+         f"<br>Impact: {impact}/10 | Effort: {effort}/10 | Priority: {priority:.2f}<br>"
+         f"Status: {status} | Points: {points}")
+        for name, impact, effort, priority, status, points in zip(
+            initiatives['name'].to_numpy(),
+            initiatives['impact_score'].to_numpy(),
+            initiatives['effort_score'].to_numpy(),
+            initiatives['priority_score'].to_numpy(),
+            initiatives['status'].to_numpy(),
+            initiatives['total_story_points'].to_numpy()
+        )
+    ]
+
+
+# Chart margins for the compact Executive Summary grid (titled and untitled
+# charts) and for the full-width portfolio charts
+MARGIN_SMALL = dict(l=30, r=10, t=20, b=30)
+MARGIN_SMALL_UNTITLED = dict(l=30, r=10, t=10, b=30)
+MARGIN_CHART = dict(l=20, r=20, t=30, b=40)
+
+
+# Only the sprint selector and the views that depend on it rerun when the
+# selection changes; the rest of the page is left as rendered.
+@st.fragment
+def sprint_deep_dive(data):
+    """Sprint selector with the selected sprint's overview and charts"""
+    sprints_df = data['sprints']
+    stories_df = data['stories']
+
+    # Sprint Selector
+    st.markdown('<div class="section-title">Sprint Deep Dive</div>', unsafe_allow_html=True)
+
+    selected_sprint = st.selectbox(
+        "Select Sprint to Analyze",
+        options=sprints_df['sprint_number'].tolist(),
+        index=len(sprints_df) - 1
+    )
+
+    sprint_data = data['sprints_by_number'][selected_sprint]
+    sprint_stories = data['stories_by_sprint'].get(selected_sprint, stories_df.iloc[:0])
+
+    # Sprint Overview
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        st.metric("Committed Points", int(sprint_data['committed_points']))
+    with col2:
+        st.metric("Completed Points", int(sprint_data['completed_points']))
+    with col3:
+        st.metric("Completion Rate", f"{sprint_data['completion_rate']*100:.0f}%")
+    with col4:
+        utilization = sprint_data['completed_points'] / sprint_data['team_capacity'] * 100
+        st.metric("Capacity Utilization", f"{utilization:.0f}%")
+
+    # Charts
+    st.markdown('<div style="margin: 25px 0 15px 0;"></div>', unsafe_allow_html=True)
+    col1, col2 = st.columns(2)
+
+    with col1:
+        fig = create_count_pie(sprint_stories['status'].value_counts(), 'Status',
+                               title=f"Sprint {selected_sprint} Story Status", height=350)
+        st.plotly_chart(fig, use_container_width=True, key="sprint_status_pie")
+
+    with col2:
+        completed_stories = data['completed_stories_by_sprint'].get(selected_sprint)
+        if completed_stories is not None:
+            cycle_time_chart = create_cycle_time_boxplot(completed_stories, height=350)
+            st.plotly_chart(cycle_time_chart, use_container_width=True, key="sprint_cycle_time")
+
+
+# ============================================================================
+# LAYOUT: 2-COLUMN (SIDEBAR + MAIN CONTENT)
+# ============================================================================
+
+# Create main layout
+sidebar_col, main_col = st.columns([1, 3])
+
+# ============================================================================
+# LEFT SIDEBAR - PROJECT OVERVIEW (PERSISTENT ACROSS TABS)
+# ============================================================================
+with sidebar_col:
+    st.markdown(SIDEBAR_HTML, unsafe_allow_html=True)
 
 # ============================================================================
 # MAIN CONTENT AREA WITH TABS
@@ -540,6 +392,16 @@ with main_col:
     </div>
     """, unsafe_allow_html=True)
 
+    # Shared precompute: current sprint scalars (read off the row once), health and risk
+    current_velocity = int(current_sprint['velocity'])
+    completion_rate = float(current_sprint['completion_rate'])
+    team_utilization = float(current_sprint['completed_points']) / float(current_sprint['team_capacity'])
+
+    health = cached_sprint_health_score(fingerprint, current_sprint, sprints_df)
+    risk_df = cached_initiatives_risk(fingerprint, current_sprint_num, team_utilization,
+                                      initiatives_df, sprints_df)
+    risk_level_counts = risk_df['risk_level'].value_counts() if len(risk_df) > 0 else None
+
     # Create tabs
     tab1, tab2, tab3, tab4 = st.tabs(["📊 Executive Summary", "🎯 Portfolio & Strategy", "⚡ Delivery & Performance", "📚 About the Data"])
 
@@ -549,62 +411,19 @@ with main_col:
     with tab1:
         st.markdown('<div style="margin: 20px 0;"></div>', unsafe_allow_html=True)
 
-        # KPI METRICS ROW
-        kpi1, kpi2, kpi3, kpi4, kpi5 = st.columns(5)
-
-        # Calculate KPI values
-        current_velocity = int(current_sprint['velocity'])
-        avg_velocity_12m = int(sprints_df['velocity'].mean())
-        completion_rate = current_sprint['completion_rate']
-        health = calculate_sprint_health_score(current_sprint, sprints_df)
+        # KPI METRICS ROW: calculate values, then render as one element
+        avg_velocity_12m = int(kpis['avg_velocity'])
         sprint_health_score = int(health['health_score'])
         total_initiatives = len(initiatives_df)
-        completed_initiatives = len(initiatives_df[initiatives_df['status'] == 'Completed'])
-
-        with kpi1:
-            st.markdown(f"""
-            <div class="kpi-card">
-                <div class="kpi-value">{current_velocity}</div>
-                <div class="kpi-label">Current Velocity</div>
-                <div class="kpi-sublabel">Story Points</div>
-            </div>
-            """, unsafe_allow_html=True)
-
-        with kpi2:
-            st.markdown(f"""
-            <div class="kpi-card">
-                <div class="kpi-value">{avg_velocity_12m}</div>
-                <div class="kpi-label">Avg Velocity 12M</div>
-                <div class="kpi-sublabel">Historical Average</div>
-            </div>
-            """, unsafe_allow_html=True)
-
-        with kpi3:
-            st.markdown(f"""
-            <div class="kpi-card">
-                <div class="kpi-value">{int(completion_rate*100)}%</div>
-                <div class="kpi-label">Completion Rate</div>
-                <div class="kpi-sublabel">Current Sprint</div>
-            </div>
-            """, unsafe_allow_html=True)
-
-        with kpi4:
-            st.markdown(f"""
-            <div class="kpi-card">
-                <div class="kpi-value">{sprint_health_score}/100</div>
-                <div class="kpi-label">Sprint Health</div>
-                <div class="kpi-sublabel">Composite Score</div>
-            </div>
-            """, unsafe_allow_html=True)
-
-        with kpi5:
-            st.markdown(f"""
-            <div class="kpi-card">
-                <div class="kpi-value">{total_initiatives}</div>
-                <div class="kpi-label">Total Projects</div>
-                <div class="kpi-sublabel">{completed_initiatives} Completed</div>
-            </div>
-            """, unsafe_allow_html=True)
+        completed_initiatives = kpis['completed_initiatives']
+
+        render_kpi_row([
+            (current_velocity, "Current Velocity", "Story Points"),
+            (avg_velocity_12m, "Avg Velocity 12M", "Historical Average"),
+            (f"{int(completion_rate*100)}%", "Completion Rate", "Current Sprint"),
+            (f"{sprint_health_score}/100", "Sprint Health", "Composite Score"),
+            (total_initiatives, "Total Projects", f"{completed_initiatives} Completed"),
+        ])
 
         # CHARTS ROW 1: Velocity, Impact/Effort Matrix, Team Heatmap
         st.markdown('<div style="margin: 30px 0 15px 0;"></div>', unsafe_allow_html=True)
@@ -613,105 +432,70 @@ with main_col:
 
         with chart1:
             st.markdown('<div class="section-title">Velocity Trend</div>', unsafe_allow_html=True)
-            velocity_chart = create_velocity_trend_chart(sprints_df)
-            velocity_chart.update_layout(height=240, margin=dict(l=30, r=10, t=20, b=30))
-            st.plotly_chart(velocity_chart, use_container_width=True)
+            velocity_chart = create_velocity_trend_chart(sprints_df, height=240, margin=MARGIN_SMALL)
+            st.plotly_chart(velocity_chart, use_container_width=True, key="velocity_trend")
 
         with chart2:
             st.markdown('<div class="section-title">Portfolio Composition</div>', unsafe_allow_html=True)
-            portfolio_chart = create_portfolio_quadrant_summary(initiatives_df)
-            portfolio_chart.update_layout(height=240, margin=dict(l=30, r=10, t=10, b=30))
-            st.plotly_chart(portfolio_chart, use_container_width=True)
+            portfolio_chart = create_portfolio_quadrant_summary(initiatives_df, height=240,
+                                                                margin=MARGIN_SMALL_UNTITLED)
+            st.plotly_chart(portfolio_chart, use_container_width=True, key="portfolio_quadrant")
 
         with chart3:
             st.markdown('<div class="section-title">Team Performance</div>', unsafe_allow_html=True)
 
-            # Create simplified heatmap data (last 6 sprints)
-            team_sprint_metrics = []
-            for sprint_num in sprints_df.tail(6)['sprint_number']:
-                sprint_stories = stories_df[stories_df['sprint_number'] == sprint_num]
-                for member_id in team_df['member_id'].head(6):  # Top 6 team members
-                    member = team_df[team_df['member_id'] == member_id].iloc[0]
-                    member_stories = sprint_stories[sprint_stories['assignee_id'] == member_id]
-                    points = member_stories['final_story_points'].sum()
-                    utilization = (points / member['avg_capacity_per_sprint'] * 100) if member['avg_capacity_per_sprint'] > 0 else 0
-
-                    team_sprint_metrics.append({
-                        'member_name': member['name'].split()[0],  # First name only
-                        'sprint_number': sprint_num,
-                        'utilization_pct': utilization
-                    })
-
-            heatmap_df = pd.DataFrame(team_sprint_metrics)
-            heatmap_chart = create_capacity_heatmap(heatmap_df)
-            heatmap_chart.update_layout(height=240, margin=dict(l=30, r=10, t=20, b=30))
-            st.plotly_chart(heatmap_chart, use_container_width=True)
+            # Simplified heatmap data (last 6 sprints, top 6 team members)
+            heatmap_df = cached_member_utilization(fingerprint, stories_df, sprints_df, team_df)
+            heatmap_chart = create_capacity_heatmap(heatmap_df, height=240, margin=MARGIN_SMALL)
+            st.plotly_chart(heatmap_chart, use_container_width=True, key="capacity_heatmap")
 
         # CHARTS ROW 2: Work Distribution Stacked Area Chart
         st.markdown('<div style="margin: 20px 0 10px 0;"></div>', unsafe_allow_html=True)
         st.markdown('<div class="section-title">Work Distribution & Completion Trends</div>', unsafe_allow_html=True)
 
-        story_type_by_sprint = calculate_story_type_distribution(stories_df)
-        stacked_area = create_story_type_stacked_area(story_type_by_sprint)
-        stacked_area.update_layout(height=220, margin=dict(l=30, r=10, t=10, b=30))
-        st.plotly_chart(stacked_area, use_container_width=True)
+        story_type_by_sprint = cached_story_type_distribution(fingerprint, stories_df)
+        stacked_area = create_story_type_stacked_area(story_type_by_sprint, height=220,
+                                                      margin=MARGIN_SMALL_UNTITLED)
+        st.plotly_chart(stacked_area, use_container_width=True, key="story_type_area")
 
         # STRATEGIC INSIGHTS & RECOMMENDATIONS (2-column layout)
         st.markdown('<div style="margin: 15px 0 10px 0;"></div>', unsafe_allow_html=True)
         st.markdown('<div class="section-title">Strategic Insights & Recommendations</div>', unsafe_allow_html=True)
 
         # Generate recommendations
-        quick_wins = get_quick_wins(initiatives_df)
-        quick_wins_backlog = quick_wins[quick_wins['status'] == 'Backlog']
-        time_sinks = get_time_sinks(initiatives_df)
+        quick_wins_backlog = kpis['quick_wins_backlog']
+        time_sinks = kpis['time_sinks']
 
         # Calculate velocity improvement
-        velocity_change = ((sprints_df.tail(3)['velocity'].mean() - sprints_df.head(3)['velocity'].mean()) /
-                          sprints_df.head(3)['velocity'].mean() * 100)
+        velocity_change = kpis['velocity_change']
 
         # Risk assessment
-        team_utilization = current_sprint['completed_points'] / current_sprint['team_capacity']
-        risk_df = assess_all_initiatives_risk(initiatives_df, current_sprint_num, sprints_df, team_utilization)
-        high_risk_count = len(risk_df[risk_df['risk_level'] == 'High']) if len(risk_df) > 0 else 0
+        high_risk_count = int(risk_level_counts.get('High', 0)) if risk_level_counts is not None else 0
 
         # Display recommendations in 2-column layout
         rec_col1, rec_col2 = st.columns(2)
 
         with rec_col1:
-            st.markdown(f"""
-            <div class="recommendation-box recommendation-box-green">
-                <strong>✅ STRENGTH:</strong> Team velocity improved {velocity_change:.0f}% over 6 months - momentum building
-            </div>
-            """, unsafe_allow_html=True)
+            predictability = kpis['predictability']
 
-            st.markdown(f"""
-            <div class="recommendation-box recommendation-box-green">
-                <strong>⚡ OPPORTUNITY:</strong> {len(quick_wins_backlog)} "Quick Win" initiatives ready for immediate delivery
-            </div>
-            """, unsafe_allow_html=True)
-
-            # Calculate predictability
-            predictability = 1 - (sprints_df['velocity'].std() / sprints_df['velocity'].mean())
-
-            st.markdown(f"""
-            <div class="recommendation-box recommendation-box-green">
-                <strong>📊 PREDICTABILITY:</strong> Sprint predictability at {predictability*100:.0f}% - reliable for forecasting
-            </div>
-            """, unsafe_allow_html=True)
+            render_recommendations([
+                ("green", "✅ STRENGTH:",
+                 f"Team velocity improved {velocity_change:.0f}% over 6 months - momentum building"),
+                ("green", "⚡ OPPORTUNITY:",
+                 f'{len(quick_wins_backlog)} "Quick Win" initiatives ready for immediate delivery'),
+                ("green", "📊 PREDICTABILITY:",
+                 f"Sprint predictability at {predictability*100:.0f}% - reliable for forecasting"),
+            ])
 
         with rec_col2:
+            alerts = []
             if high_risk_count > 0:
-                st.markdown(f"""
-                <div class="recommendation-box recommendation-box-red">
-                    <strong>🚨 ALERT:</strong> {high_risk_count} initiatives flagged high-risk - realign scope or extend timeline
-                </div>
-                """, unsafe_allow_html=True)
-
-            st.markdown(f"""
-            <div class="recommendation-box recommendation-box-orange">
-                <strong>⚠️ OPTIMIZATION:</strong> Deprioritize {len(time_sinks)} "Time Sink" initiatives to free capacity
-            </div>
-            """, unsafe_allow_html=True)
+                alerts.append(("red", "🚨 ALERT:",
+                               f"{high_risk_count} initiatives flagged high-risk - realign scope or extend timeline"))
+            alerts.append(("orange", "⚠️ OPTIMIZATION:",
+                           f'Deprioritize {len(time_sinks)} "Time Sink" initiatives to free capacity'))
+
+            render_recommendations(alerts)
 
         # PROJECT RESULTS & BUSINESS VALUE
         st.markdown('<div style="margin: 15px 0 0 0;"></div>', unsafe_allow_html=True)
@@ -743,26 +527,15 @@ with main_col:
         col1, col2 = st.columns([2, 1])
 
         with col1:
-            matrix_chart = create_impact_effort_matrix(initiatives_df)
-            matrix_chart.update_layout(height=450, margin=dict(l=20, r=20, t=30, b=40))
-            st.plotly_chart(matrix_chart, use_container_width=True)
+            matrix_chart = create_impact_effort_matrix(initiatives_df, height=450, margin=MARGIN_CHART)
+            st.plotly_chart(matrix_chart, use_container_width=True, key="impact_effort_matrix")
 
         with col2:
             st.markdown("**Portfolio Composition**")
-            composition = get_portfolio_composition(initiatives_df)
-
-            fig = px.bar(composition, x='quadrant', y='initiative_count',
-                        color='quadrant', color_discrete_map={
-                            'Quick Wins': COLORS['success'],
-                            'Major Projects': COLORS['primary'],
-                            'Fill-ins': COLORS['neutral'],
-                            'Time Sinks': COLORS['danger']
-                        },
-                        text='initiative_count',
-                        labels={'initiative_count': 'Count', 'quadrant': 'Quadrant'})
-            fig.update_traces(textposition='outside')
-            fig.update_layout(showlegend=False, height=450)
-            st.plotly_chart(fig, use_container_width=True)
+            composition = kpis['composition']
+
+            fig = create_portfolio_composition_bar(composition, height=450)
+            st.plotly_chart(fig, use_container_width=True, key="portfolio_composition")
 
         # Quick Wins and Time Sinks
         st.markdown('<div style="margin: 25px 0 15px 0;"></div>', unsafe_allow_html=True)
@@ -770,29 +543,13 @@ with main_col:
 
         with col1:
             st.markdown('<div class="section-title">⚡ Top Quick Wins</div>', unsafe_allow_html=True)
-            quick_wins = get_quick_wins(initiatives_df, limit=5)
-            for _, init in quick_wins.iterrows():
-                st.markdown(f"""
-                <div class="recommendation-box recommendation-box-green">
-                    <strong>{init['name']}</strong><br>
-                    Impact: {init['impact_score']}/10 | Effort: {init['effort_score']}/10 |
-                    Priority: {init['priority_score']:.2f}<br>
-                    Status: {init['status']} | Points: {init['total_story_points']}
-                </div>
-                """, unsafe_allow_html=True)
+            quick_wins = kpis['quick_wins'].head(5)
+            render_recommendations(initiative_recommendations(quick_wins, 'green'))
 
         with col2:
             st.markdown('<div class="section-title">⚠️ Time Sinks to Deprioritize</div>', unsafe_allow_html=True)
-            time_sinks = get_time_sinks(initiatives_df).head(5)
-            for _, init in time_sinks.iterrows():
-                st.markdown(f"""
-                <div class="recommendation-box recommendation-box-orange">
-                    <strong>{init['name']}</strong><br>
-                    Impact: {init['impact_score']}/10 | Effort: {init['effort_score']}/10 |
-                    Priority: {init['priority_score']:.2f}<br>
-                    Status: {init['status']} | Points: {init['total_story_points']}
-                </div>
-                """, unsafe_allow_html=True)
+            time_sinks = kpis['time_sinks'].head(5)
+            render_recommendations(initiative_recommendations(time_sinks, 'orange'))
 
         # Strategic Trends
         st.markdown('<div style="margin: 30px 0 15px 0;"></div>', unsafe_allow_html=True)
@@ -802,61 +559,37 @@ with main_col:
 
         with col1:
             # Velocity Stability
-            fig = go.Figure()
-            fig.add_trace(go.Scatter(
-                x=sprints_df['sprint_number'],
-                y=sprints_df['velocity'],
-                name='Velocity',
-                mode='lines+markers',
-                line=dict(color=COLORS['primary'], width=3)
-            ))
-
-            if 'velocity_rolling_avg' in sprints_df.columns:
-                fig.add_trace(go.Scatter(
-                    x=sprints_df['sprint_number'],
-                    y=sprints_df['velocity_rolling_avg'],
-                    name='3-Sprint Avg',
-                    mode='lines',
-                    line=dict(color=COLORS['warning'], width=2, dash='dash')
-                ))
-
-            fig.update_layout(
-                title='Velocity Stability Over Time',
-                xaxis_title='Sprint Number',
-                yaxis_title='Story Points',
-                height=350
-            )
-            st.plotly_chart(fig, use_container_width=True)
+            fig = create_velocity_stability_chart(sprints_df, height=350)
+            st.plotly_chart(fig, use_container_width=True, key="velocity_stability")
 
         with col2:
             # ROI Scatter
-            completed_initiatives = initiatives_df[initiatives_df['status'] == 'Completed']
+            completed_initiatives = data['completed_initiatives']
             if len(completed_initiatives) > 0:
-                roi_scatter = create_roi_scatter(completed_initiatives)
-                roi_scatter.update_layout(height=350)
-                st.plotly_chart(roi_scatter, use_container_width=True)
+                roi_scatter = create_roi_scatter(completed_initiatives, height=350)
+                st.plotly_chart(roi_scatter, use_container_width=True, key="roi_scatter")
 
         # Key Metrics
         col1, col2, col3, col4 = st.columns(4)
 
-        early_velocity = sprints_df.head(3)['velocity'].mean()
-        late_velocity = sprints_df.tail(3)['velocity'].mean()
-        improvement = ((late_velocity - early_velocity) / early_velocity * 100)
+        early_velocity = kpis['early_velocity']
+        late_velocity = kpis['late_velocity']
+        improvement = kpis['velocity_change']
 
         with col1:
             st.metric("Velocity Improvement", f"{improvement:.0f}%",
                      delta=f"{late_velocity - early_velocity:.0f} pts")
 
         with col2:
-            predictability = 1 - (sprints_df['velocity'].std() / sprints_df['velocity'].mean())
+            predictability = kpis['predictability']
             st.metric("Predictability", f"{predictability*100:.0f}%")
 
         with col3:
-            success_rate = len(completed_initiatives) / len(initiatives_df) * 100 if len(initiatives_df) > 0 else 0
+            success_rate = kpis['completed_initiatives'] / len(initiatives_df) * 100 if len(initiatives_df) > 0 else 0
             st.metric("Initiative Success Rate", f"{success_rate:.0f}%")
 
         with col4:
-            st.metric("Total Delivered", f"{sprints_df['completed_points'].sum():.0f} pts")
+            st.metric("Total Delivered", f"{kpis['total_delivered']:.0f} pts")
 
     # ========================================================================
     # TAB 3: DELIVERY & PERFORMANCE
@@ -864,65 +597,16 @@ with main_col:
     with tab3:
         st.markdown('<div style="margin: 20px 0;"></div>', unsafe_allow_html=True)
 
-        # Sprint Selector
-        st.markdown('<div class="section-title">Sprint Deep Dive</div>', unsafe_allow_html=True)
-
-        selected_sprint = st.selectbox(
-            "Select Sprint to Analyze",
-            options=sprints_df['sprint_number'].tolist(),
-            index=len(sprints_df) - 1
-        )
-
-        sprint_data = sprints_df[sprints_df['sprint_number'] == selected_sprint].iloc[0]
-        sprint_stories = stories_df[stories_df['sprint_number'] == selected_sprint]
-
-        # Sprint Overview
-        col1, col2, col3, col4 = st.columns(4)
-
-        with col1:
-            st.metric("Committed Points", int(sprint_data['committed_points']))
-        with col2:
-            st.metric("Completed Points", int(sprint_data['completed_points']))
-        with col3:
-            st.metric("Completion Rate", f"{sprint_data['completion_rate']*100:.0f}%")
-        with col4:
-            utilization = sprint_data['completed_points'] / sprint_data['team_capacity'] * 100
-            st.metric("Capacity Utilization", f"{utilization:.0f}%")
-
-        # Charts
-        st.markdown('<div style="margin: 25px 0 15px 0;"></div>', unsafe_allow_html=True)
-        col1, col2 = st.columns(2)
-
-        with col1:
-            status_counts = sprint_stories['status'].value_counts().reset_index()
-            status_counts.columns = ['Status', 'Count']
-
-            fig = px.pie(status_counts, values='Count', names='Status',
-                        title=f"Sprint {selected_sprint} Story Status")
-            fig.update_layout(height=350)
-            st.plotly_chart(fig, use_container_width=True)
-
-        with col2:
-            completed_stories = sprint_stories[sprint_stories['status'] == 'Completed']
-            if len(completed_stories) > 0:
-                cycle_time_chart = create_cycle_time_boxplot(completed_stories)
-                cycle_time_chart.update_layout(height=350)
-                st.plotly_chart(cycle_time_chart, use_container_width=True)
+        sprint_deep_dive(data)
 
         # Team Performance
         st.markdown('<div style="margin: 30px 0 15px 0;"></div>', unsafe_allow_html=True)
         st.markdown('<div class="section-title">Team Performance Analytics</div>', unsafe_allow_html=True)
 
-        completed_stories_all = stories_df[stories_df['status'] == 'Completed']
-        velocity_contrib = calculate_team_velocity_contribution(completed_stories_all, team_df)
+        velocity_contrib = calculate_team_velocity_contribution(data['completed_stories'], team_df)
 
-        fig = px.bar(velocity_contrib, x='points_delivered', y='name', orientation='h',
-                    color='points_delivered', color_continuous_scale='Blues',
-                    text='points_delivered',
-                    labels={'points_delivered': 'Story Points Delivered', 'name': 'Team Member'})
-        fig.update_traces(textposition='outside')
-        fig.update_layout(showlegend=False, height=400)
-        st.plotly_chart(fig, use_container_width=True)
+        fig = create_velocity_contribution_bar(velocity_contrib, height=400)
+        st.plotly_chart(fig, use_container_width=True, key="team_velocity")
 
         # Predictive Insights
         st.markdown('<div style="margin: 30px 0 15px 0;"></div>', unsafe_allow_html=True)
@@ -931,10 +615,8 @@ with main_col:
         col1, col2 = st.columns([1, 2])
 
         with col1:
-            health = calculate_sprint_health_score(current_sprint, sprints_df)
-            health_gauge = create_health_gauge(health['health_score'])
-            health_gauge.update_layout(height=300)
-            st.plotly_chart(health_gauge, use_container_width=True)
+            health_gauge = create_health_gauge(health['health_score'], height=300)
+            st.plotly_chart(health_gauge, use_container_width=True, key="health_gauge")
 
             if health['health_score'] >= 80:
                 st.success("✅ **Excellent** - Sprint on track")
@@ -945,19 +627,11 @@ with main_col:
 
         with col2:
             # Risk assessment
-            team_utilization = current_sprint['completed_points'] / current_sprint['team_capacity']
-            risk_df = assess_all_initiatives_risk(initiatives_df, current_sprint_num, sprints_df, team_utilization)
-
-            if len(risk_df) > 0:
-                risk_counts = risk_df['risk_level'].value_counts().reset_index()
-                risk_counts.columns = ['Risk Level', 'Count']
-
-                risk_colors = {'Low': COLORS['success'], 'Medium': COLORS['warning'], 'High': COLORS['danger']}
-                fig = px.pie(risk_counts, values='Count', names='Risk Level',
-                            color='Risk Level', color_discrete_map=risk_colors,
-                            title='Initiative Risk Distribution')
-                fig.update_layout(height=300)
-                st.plotly_chart(fig, use_container_width=True)
+            if risk_level_counts is not None:
+                fig = create_count_pie(risk_level_counts, 'Risk Level',
+                                       title='Initiative Risk Distribution', color_map=RISK_COLORS,
+                                       height=300)
+                st.plotly_chart(fig, use_container_width=True, key="risk_distribution")
 
         # Velocity Forecast
         st.markdown('<div style="margin: 25px 0 15px 0;"></div>', unsafe_allow_html=True)
@@ -965,32 +639,8 @@ with main_col:
         forecast = forecast_velocity_next_n_sprints(sprints_df, n_sprints=3)
         future_sprints = list(range(current_sprint_num + 1, current_sprint_num + 4))
 
-        fig = go.Figure()
-
-        fig.add_trace(go.Scatter(
-            x=sprints_df['sprint_number'],
-            y=sprints_df['velocity'],
-            name='Historical',
-            mode='lines+markers',
-            line=dict(color=COLORS['primary'], width=2)
-        ))
-
-        fig.add_trace(go.Scatter(
-            x=future_sprints,
-            y=forecast['forecast'],
-            name='Forecast',
-            mode='lines+markers',
-            line=dict(color=COLORS['warning'], width=2, dash='dash')
-        ))
-
-        fig.update_layout(
-            title='Velocity Forecast (Next 3 Sprints)',
-            xaxis_title='Sprint Number',
-            yaxis_title='Story Points',
-            height=350
-        )
-
-        st.plotly_chart(fig, use_container_width=True)
+        fig = create_velocity_forecast_chart(sprints_df, future_sprints, forecast['forecast'], height=350)
+        st.plotly_chart(fig, use_container_width=True, key="velocity_forecast")
 
     # ========================================================================
     # TAB 4: ABOUT THE DATA
@@ -1006,51 +656,22 @@ with main_col:
         """)
 
         # Data Overview
-        col1, col2, col3 = st.columns(3)
-
-        with col1:
-            st.markdown(f"""
-            <div class="kpi-card">
-                <div class="kpi-value">{len(sprints_df)}</div>
-                <div class="kpi-label">Total Sprints</div>
-                <div class="kpi-sublabel">2-week iterations</div>
-            </div>
-            """, unsafe_allow_html=True)
-
-        with col2:
-            st.markdown(f"""
-            <div class="kpi-card">
-                <div class="kpi-value">{len(stories_df)}</div>
-                <div class="kpi-label">User Stories</div>
-                <div class="kpi-sublabel">Across all sprints</div>
-            </div>
-            """, unsafe_allow_html=True)
-
-        with col3:
-            st.markdown(f"""
-            <div class="kpi-card">
-                <div class="kpi-value">{len(initiatives_df)}</div>
-                <div class="kpi-label">Initiatives</div>
-                <div class="kpi-sublabel">Strategic projects</div>
-            </div>
-            """, unsafe_allow_html=True)
+        render_kpi_row([
+            (len(sprints_df), "Total Sprints", "2-week iterations"),
+            (len(stories_df), "User Stories", "Across all sprints"),
+            (len(initiatives_df), "Initiatives", "Strategic projects"),
+        ])
 
         st.markdown('<div style="margin: 25px 0 15px 0;"></div>', unsafe_allow_html=True)
 
         # Sprint Details
         st.markdown('<div class="section-title">Sprint Timeline & Context</div>', unsafe_allow_html=True)
 
-        # Create sprint summary table
-        sprint_summary = sprints_df[['sprint_number', 'committed_points', 'completed_points',
-                                     'completion_rate', 'velocity']].copy()
-        sprint_summary['completion_rate'] = (sprint_summary['completion_rate'] * 100).round(0).astype(int)
-        sprint_summary.columns = ['Sprint #', 'Committed', 'Completed', 'Completion %', 'Velocity']
-
         st.markdown("""
         **Sprint Overview Table** - Select any sprint number in the "Delivery & Performance" tab to analyze specific metrics.
         """)
 
-        st.dataframe(sprint_summary, use_container_width=True, hide_index=True)
+        st.dataframe(data['sprint_summary'], use_container_width=True, hide_index=True)
 
         st.markdown('<div style="margin: 25px 0 15px 0;"></div>', unsafe_allow_html=True)
 
@@ -1060,36 +681,15 @@ with main_col:
         with col1:
             st.markdown('<div class="section-title">Story Type Breakdown</div>', unsafe_allow_html=True)
 
-            story_types = stories_df['story_type'].value_counts().reset_index()
-            story_types.columns = ['Story Type', 'Count']
-
-            fig = px.pie(story_types, values='Count', names='Story Type',
-                        color='Story Type',
-                        color_discrete_map={
-                            'Feature': COLORS['primary'],
-                            'Bug': COLORS['danger'],
-                            'Technical Debt': COLORS['warning'],
-                            'Spike': COLORS['neutral']
-                        })
-            fig.update_layout(height=300)
-            st.plotly_chart(fig, use_container_width=True)
+            fig = create_count_pie(stories_df['story_type'].value_counts(), 'Story Type',
+                                   color_map=STORY_TYPE_COLORS, height=300)
+            st.plotly_chart(fig, use_container_width=True, key="story_type_pie")
 
         with col2:
             st.markdown('<div class="section-title">Initiative Status</div>', unsafe_allow_html=True)
 
-            initiative_status = initiatives_df['status'].value_counts().reset_index()
-            initiative_status.columns = ['Status', 'Count']
-
-            fig = px.bar(initiative_status, x='Status', y='Count',
-                        color='Status',
-                        color_discrete_map={
-                            'Completed': COLORS['success'],
-                            'Active': COLORS['primary'],
-                            'Backlog': COLORS['neutral'],
-                            'Deprioritized': COLORS['danger']
-                        })
-            fig.update_layout(height=300, showlegend=False)
-            st.plotly_chart(fig, use_container_width=True)
+            fig = create_initiative_status_bar(data['initiative_status_counts'], height=300)
+            st.plotly_chart(fig, use_container_width=True, key="initiative_status")
 
         st.markdown('<div style="margin: 25px 0 15px 0;"></div>', unsafe_allow_html=True)
 
@@ -4,12 +4,59 @@ Data Processing Utilities
 Handles loading, cleaning, and transforming sprint analytics data.
 """
 
+import os
+
 import pandas as pd
 import numpy as np
+import pyarrow as pa
 from datetime import datetime
 import streamlit as st
 
 
+# Source CSV for each table
+DATA_FILES = {
+    'sprints': 'data/sprint_data.csv',
+    'stories': 'data/story_data.csv',
+    'initiatives': 'data/initiative_data.csv',
+    'team': 'data/team_data.csv'
+}
+
+# Directory holding the parquet copies of the prepared tables
+CACHE_DIR = '.cache'
+
+# Date format written by data/generate_data.py
+DATE_FORMAT = '%Y-%m-%d'
+
+# Low-cardinality story columns used as groupby keys
+STORY_CATEGORICAL_COLUMNS = ['story_type', 'priority']
+
+
+def optimize_dtypes(df, categorical_columns=()):
+    """
+    Downcast integer columns and convert grouping keys to categoricals.
+
+    Sprint numbers, story points and scores are small bounded integers, so
+    int64 wastes most of each value. Float columns are left at float64 since
+    rates and accuracies are displayed as rounded percentages.
+
+    Args:
+        df: DataFrame to optimize
+        categorical_columns: Columns to convert to 'category' dtype
+
+    Returns:
+        DataFrame: Copy with compact dtypes
+    """
+    df = df.copy()
+
+    for column in df.select_dtypes(include='integer').columns:
+        df[column] = pd.to_numeric(df[column], downcast='integer')
+
+    for column in categorical_columns:
+        df[column] = df[column].astype('category')
+
+    return df
+
+
 @st.cache_data
 def load_all_data():
     """
@@ -19,27 +66,103 @@ def load_all_data():
         dict: Dictionary containing 'sprints', 'stories', 'initiatives', 'team'
     """
     try:
-        sprints = pd.read_csv('data/sprint_data.csv')
-        stories = pd.read_csv('data/story_data.csv')
-        initiatives = pd.read_csv('data/initiative_data.csv')
-        team = pd.read_csv('data/team_data.csv')
-
-        # Convert date columns
-        sprints['start_date'] = pd.to_datetime(sprints['start_date'])
-        sprints['end_date'] = pd.to_datetime(sprints['end_date'])
-        stories['start_date'] = pd.to_datetime(stories['start_date'])
+        # Date columns are parsed by the CSV reader with a fixed format
+        # instead of a second to_datetime pass with format inference
+        sprints = pd.read_csv(DATA_FILES['sprints'], parse_dates=['start_date', 'end_date'],
+                              date_format=DATE_FORMAT)
+        stories = pd.read_csv(DATA_FILES['stories'], parse_dates=['start_date'],
+                              date_format=DATE_FORMAT)
+        initiatives = pd.read_csv(DATA_FILES['initiatives'])
+        team = pd.read_csv(DATA_FILES['team'])
 
         return {
-            'sprints': sprints,
-            'stories': stories,
-            'initiatives': initiatives,
-            'team': team
+            'sprints': optimize_dtypes(sprints),
+            'stories': optimize_dtypes(stories, STORY_CATEGORICAL_COLUMNS),
+            'initiatives': optimize_dtypes(initiatives),
+            'team': optimize_dtypes(team)
         }
     except FileNotFoundError as e:
         st.error(f"Data files not found. Please run: python data/generate_data.py")
         st.stop()
 
 
+def _cache_path(name, cache_dir):
+    return os.path.join(cache_dir, f'{name}.parquet')
+
+
+def load_table_cache(dependencies, cache_dir=CACHE_DIR):
+    """
+    Load prepared tables from the on-disk parquet cache.
+
+    The cache is only used when every table file is newer than every
+    dependency (source CSVs and the code that prepares them).
+
+    Args:
+        dependencies: File paths whose modification invalidates the cache
+        cache_dir: Directory holding the parquet files
+
+    Returns:
+        dict: Tables keyed like DATA_FILES, or None if the cache is stale or missing
+    """
+    try:
+        newest_dependency = max(os.path.getmtime(path) for path in dependencies)
+        paths = {name: _cache_path(name, cache_dir) for name in DATA_FILES}
+
+        if any(os.path.getmtime(path) <= newest_dependency for path in paths.values()):
+            return None
+
+        return {name: pd.read_parquet(path) for name, path in paths.items()}
+    except (OSError, ImportError, ValueError):
+        return None
+
+
+def save_table_cache(tables, cache_dir=CACHE_DIR):
+    """
+    Write prepared tables to the on-disk parquet cache.
+
+    Failures (read-only filesystem, missing parquet engine) are ignored;
+    the next cold start simply rebuilds from the CSVs.
+
+    Args:
+        tables: Dictionary of DataFrames keyed like DATA_FILES
+        cache_dir: Directory to write the parquet files to
+    """
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        for name in DATA_FILES:
+            tables[name].to_parquet(_cache_path(name, cache_dir))
+    except (OSError, ImportError, ValueError):
+        pass
+
+
+def data_fingerprint(tables):
+    """
+    Build a cheap cache key for the loaded tables.
+
+    Uses row counts plus a few column totals instead of hashing every cell,
+    which is enough to tell regenerated data sets apart.
+
+    Args:
+        tables: Dictionary with 'sprints', 'stories', 'initiatives' DataFrames
+
+    Returns:
+        tuple: Hashable fingerprint of the data
+    """
+    sprints = tables['sprints']
+    stories = tables['stories']
+    initiatives = tables['initiatives']
+
+    return (
+        len(sprints),
+        int(sprints['sprint_number'].iloc[-1]) if len(sprints) > 0 else 0,
+        int(sprints['velocity'].sum()),
+        len(stories),
+        int(stories['final_story_points'].sum()),
+        len(initiatives),
+        int(initiatives['completed_story_points'].sum())
+    )
+
+
 def get_current_sprint(sprints_df):
     """
     Get the most recent sprint (assume it's the current one).
@@ -53,6 +176,22 @@ def get_current_sprint(sprints_df):
     return sprints_df.iloc[-1]
 
 
+def index_sprints_by_number(sprints_df):
+    """
+    Build a lookup of sprint rows keyed by sprint number.
+
+    Args:
+        sprints_df: Sprint DataFrame
+
+    Returns:
+        dict: Sprint number -> sprint data (Series)
+    """
+    return {
+        int(sprint_number): sprints_df.iloc[position]
+        for position, sprint_number in enumerate(sprints_df['sprint_number'])
+    }
+
+
 def get_sprint_stories(stories_df, sprint_number):
     """
     Get all stories for a specific sprint.
@@ -94,9 +233,10 @@ def calculate_rolling_metrics(sprints_df, window=3):
     """
     df = sprints_df.copy()
 
-    # Rolling averages
-    df['velocity_rolling_avg'] = df['velocity'].rolling(window=window, min_periods=1).mean()
-    df['velocity_rolling_std'] = df['velocity'].rolling(window=window, min_periods=1).std()
+    # Rolling averages (one window object shared by both velocity aggregates)
+    velocity_window = df['velocity'].rolling(window=window, min_periods=1)
+    df['velocity_rolling_avg'] = velocity_window.mean()
+    df['velocity_rolling_std'] = velocity_window.std()
     df['completion_rate_rolling_avg'] = df['completion_rate'].rolling(window=window, min_periods=1).mean()
 
     return df
@@ -161,7 +301,7 @@ def calculate_story_type_distribution(stories_df):
     Returns:
         DataFrame: Story type distribution by sprint
     """
-    return stories_df.groupby(['sprint_number', 'story_type']).size().reset_index(name='count')
+    return stories_df.groupby(['sprint_number', 'story_type'], observed=True).size().reset_index(name='count')
 
 
 def get_completed_stories(stories_df):
@@ -177,6 +317,22 @@ def get_completed_stories(stories_df):
     return stories_df[stories_df['status'] == 'Completed'].copy()
 
 
+def group_stories_by_sprint(stories_df):
+    """
+    Split stories into one DataFrame per sprint.
+
+    Args:
+        stories_df: Stories DataFrame
+
+    Returns:
+        dict: Sprint number -> stories in that sprint (DataFrame)
+    """
+    return {
+        int(sprint_number): sprint_stories
+        for sprint_number, sprint_stories in stories_df.groupby('sprint_number')
+    }
+
+
 def get_stories_by_status(stories_df, sprint_number=None):
     """
     Get story counts by status, optionally for a specific sprint.
@@ -205,19 +361,14 @@ def calculate_team_member_metrics(stories_df, team_df):
     Returns:
         DataFrame: Team member metrics
     """
-    # Aggregate by team member
-    member_metrics = stories_df.groupby('assignee_id').agg({
-        'story_points': 'sum',
-        'final_story_points': 'sum',
-        'cycle_time_days': 'mean',
-        'story_id': 'count',
-        'estimation_accuracy': 'mean'
-    }).reset_index()
-
-    member_metrics.columns = [
-        'member_id', 'total_points_planned', 'total_points_delivered',
-        'avg_cycle_time', 'stories_completed', 'avg_estimation_accuracy'
-    ]
+    # Aggregate by team member (named aggregations, no rename pass)
+    member_metrics = stories_df.groupby('assignee_id').agg(
+        total_points_planned=('story_points', 'sum'),
+        total_points_delivered=('final_story_points', 'sum'),
+        avg_cycle_time=('cycle_time_days', 'mean'),
+        stories_completed=('story_id', 'count'),
+        avg_estimation_accuracy=('estimation_accuracy', 'mean')
+    ).rename_axis('member_id').reset_index()
 
     # Merge with team data
     member_metrics = member_metrics.merge(team_df, on='member_id', how='left')
@@ -296,3 +447,25 @@ def get_sprint_summary_stats(sprints_df, stories_df):
         'avg_cycle_time': stories_df['cycle_time_days'].mean(),
         'total_blockers': stories_df['num_blockers'].sum(),
     }
+
+
+def build_sprint_summary_table(sprints_df):
+    """
+    Build the per-sprint overview table shown on the Data Overview tab.
+
+    The table is returned as Arrow so st.dataframe can send it as is rather
+    than converting from pandas on every rerun.
+
+    Args:
+        sprints_df: Sprints DataFrame
+
+    Returns:
+        pa.Table: Sprint #, Committed, Completed, Completion % and Velocity
+    """
+    return pa.table({
+        'Sprint #': sprints_df['sprint_number'].to_numpy(),
+        'Committed': sprints_df['committed_points'].to_numpy(),
+        'Completed': sprints_df['completed_points'].to_numpy(),
+        'Completion %': np.round(sprints_df['completion_rate'].to_numpy() * 100).astype(int),
+        'Velocity': sprints_df['velocity'].to_numpy()
+    })
@@ -98,6 +98,35 @@ def calculate_velocity_trend(sprints_df):
     }
 
 
+def calculate_velocity_summary(sprints_df, window=3):
+    """
+    Calculate headline velocity statistics from one pass over the velocity column.
+
+    Args:
+        sprints_df: Sprint DataFrame
+        window: Number of sprints at each end used for early/late averages (default 3)
+
+    Returns:
+        dict: mean, std (sample), early, late, change_pct and predictability
+    """
+    velocities = sprints_df['velocity'].to_numpy(dtype=float)
+
+    mean_velocity = velocities.mean()
+    # ddof=1 matches pandas' Series.std used elsewhere in the dashboard
+    std_velocity = velocities.std(ddof=1)
+    early_velocity = velocities[:window].mean()
+    late_velocity = velocities[-window:].mean()
+
+    return {
+        'mean': mean_velocity,
+        'std': std_velocity,
+        'early': early_velocity,
+        'late': late_velocity,
+        'change_pct': (late_velocity - early_velocity) / early_velocity * 100,
+        'predictability': 1 - (std_velocity / mean_velocity)
+    }
+
+
 def calculate_predictability_score(sprints_df):
     """
     Calculate team predictability based on velocity variance.
@@ -132,21 +161,21 @@ def calculate_cycle_time_metrics(stories_df):
     Returns:
         dict: Cycle time metrics
     """
-    cycle_times = stories_df['cycle_time_days'].values
+    cycle_times = stories_df['cycle_time_days'].to_numpy()
 
     mean_cycle_time = np.mean(cycle_times)
     std_cycle_time = np.std(cycle_times)
+    # np.median selects via partition, no full sort
     median_cycle_time = np.median(cycle_times)
 
     # Control limits (3 sigma)
     upper_control_limit = mean_cycle_time + (3 * std_cycle_time)
     lower_control_limit = max(0, mean_cycle_time - (3 * std_cycle_time))
 
-    # Identify outliers
-    outliers = stories_df[
-        (stories_df['cycle_time_days'] > upper_control_limit) |
-        (stories_df['cycle_time_days'] < lower_control_limit)
-    ]
+    # Count outliers on the array (no filtered DataFrame copy)
+    num_outliers = int(np.count_nonzero(
+        (cycle_times > upper_control_limit) | (cycle_times < lower_control_limit)
+    ))
 
     return {
         'mean': mean_cycle_time,
@@ -154,8 +183,8 @@ def calculate_cycle_time_metrics(stories_df):
         'std': std_cycle_time,
         'upper_control_limit': upper_control_limit,
         'lower_control_limit': lower_control_limit,
-        'num_outliers': len(outliers),
-        'outlier_rate': len(outliers) / len(stories_df) if len(stories_df) > 0 else 0
+        'num_outliers': num_outliers,
+        'outlier_rate': num_outliers / len(stories_df) if len(stories_df) > 0 else 0
     }
 
 
@@ -213,6 +242,42 @@ def calculate_capacity_utilization(sprint_data):
     }
 
 
+def calculate_member_utilization_by_sprint(stories_df, sprints_df, team_df, n_sprints=6, n_members=6):
+    """
+    Calculate per-member capacity utilization for the most recent sprints.
+
+    Args:
+        stories_df: Stories DataFrame
+        sprints_df: Sprint DataFrame
+        team_df: Team DataFrame
+        n_sprints: Number of most recent sprints to include (default 6)
+        n_members: Number of team members to include (default 6)
+
+    Returns:
+        DataFrame: Columns [member_name, sprint_number, utilization_pct], one row per sprint/member
+    """
+    sprint_numbers = sprints_df['sprint_number'].tail(n_sprints).to_numpy()
+    members = team_df.head(n_members)
+
+    # Points per (sprint, member) from one grouped pass, laid out as a sprint x member grid
+    points = (
+        stories_df.groupby(['sprint_number', 'assignee_id'])['final_story_points'].sum()
+        .unstack(fill_value=0)
+        .reindex(index=sprint_numbers, columns=members['member_id'].to_numpy(), fill_value=0)
+        .to_numpy()
+    )
+
+    # Broadcast each member's capacity across the sprint rows (0% when capacity is 0)
+    capacity = members['avg_capacity_per_sprint'].to_numpy()
+    utilization = np.divide(points, capacity, out=np.zeros(points.shape), where=capacity > 0) * 100
+
+    return pd.DataFrame({
+        'member_name': np.tile(members['name'].str.split().str[0].to_numpy(), len(sprint_numbers)),  # First name only
+        'sprint_number': np.repeat(sprint_numbers, len(members)),
+        'utilization_pct': utilization.ravel()
+    })
+
+
 def calculate_estimation_accuracy_trend(stories_df):
     """
     Calculate how estimation accuracy changes over sprints.
@@ -242,7 +307,7 @@ def calculate_story_type_mix(stories_df):
     Returns:
         DataFrame: Story type distribution
     """
-    type_counts = stories_df.groupby('story_type').size().reset_index(name='count')
+    type_counts = stories_df.groupby('story_type', observed=True).size().reset_index(name='count')
     type_counts['percentage'] = type_counts['count'] / type_counts['count'].sum() * 100
 
     return type_counts
@@ -326,12 +391,10 @@ def calculate_team_velocity_contribution(stories_df, team_df):
     """
     completed_stories = stories_df[stories_df['status'] == 'Completed']
 
-    velocity_contrib = completed_stories.groupby('assignee_id').agg({
-        'final_story_points': 'sum',
-        'story_id': 'count'
-    }).reset_index()
-
-    velocity_contrib.columns = ['member_id', 'points_delivered', 'stories_completed']
+    velocity_contrib = completed_stories.groupby('assignee_id').agg(
+        points_delivered=('final_story_points', 'sum'),
+        stories_completed=('story_id', 'count')
+    ).rename_axis('member_id').reset_index()
 
     # Calculate percentage
     total_points = velocity_contrib['points_delivered'].sum()
@@ -361,20 +424,13 @@ def calculate_work_distribution_by_role(stories_df, team_df):
     Returns:
         DataFrame: Work distribution by role
     """
-    # Merge to get roles
-    stories_with_roles = stories_df.merge(
-        team_df[['member_id', 'role']],
-        left_on='assignee_id',
-        right_on='member_id',
-        how='left'
-    )
+    # Look up each story's role instead of merging the full stories frame
+    roles = stories_df['assignee_id'].map(team_df.set_index('member_id')['role']).rename('role')
 
-    role_distribution = stories_with_roles.groupby('role').agg({
-        'story_points': 'sum',
-        'story_id': 'count'
-    }).reset_index()
-
-    role_distribution.columns = ['role', 'total_points', 'story_count']
+    role_distribution = stories_df.groupby(roles).agg(
+        total_points=('story_points', 'sum'),
+        story_count=('story_id', 'count')
+    ).reset_index()
 
     # Calculate percentages
     total_points = role_distribution['total_points'].sum()
@@ -400,7 +456,7 @@ def identify_bottlenecks(stories_df, team_df):
     bottlenecks = []
 
     # 1. Story types with longest cycle time
-    cycle_time_by_type = stories_df.groupby('story_type')['cycle_time_days'].mean().sort_values(ascending=False)
+    cycle_time_by_type = stories_df.groupby('story_type', observed=True)['cycle_time_days'].mean().sort_values(ascending=False)
     if len(cycle_time_by_type) > 0:
         slowest_type = cycle_time_by_type.index[0]
         slowest_time = cycle_time_by_type.values[0]
@@ -463,9 +519,9 @@ def calculate_quality_trend(stories_df):
     Returns:
         DataFrame: Bug ratio by sprint
     """
-    bug_ratio_by_sprint = stories_df.groupby('sprint_number').apply(
-        lambda x: len(x[x['story_type'] == 'Bug']) / len(x) * 100 if len(x) > 0 else 0
-    ).reset_index()
+    # Mean of a boolean mask per sprint = share of bugs, no per-group callback
+    is_bug = stories_df['story_type'] == 'Bug'
+    bug_ratio_by_sprint = (is_bug.groupby(stories_df['sprint_number']).mean() * 100).reset_index()
 
     bug_ratio_by_sprint.columns = ['sprint_number', 'bug_ratio_pct']
 
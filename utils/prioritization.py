@@ -60,6 +60,24 @@ def calculate_priority_score(initiative):
     return priority_score
 
 
+def _map_multiplier(df, column, multipliers):
+    """
+    Look up a per-row multiplier, defaulting to 1.0 for missing or unknown values.
+
+    Args:
+        df: Initiatives DataFrame
+        column: Column holding the lookup key
+        multipliers: Mapping of key to multiplier
+
+    Returns:
+        ndarray or float: Multiplier for each row
+    """
+    if column not in df.columns:
+        return 1.0
+
+    return df[column].map(multipliers).fillna(1.0).to_numpy(dtype=float)
+
+
 def add_priority_scores(initiatives_df):
     """
     Add priority scores to initiatives DataFrame.
@@ -72,8 +90,15 @@ def add_priority_scores(initiatives_df):
     """
     df = initiatives_df.copy()
 
-    # Calculate priority score for each initiative
-    df['priority_score'] = df.apply(calculate_priority_score, axis=1)
+    # Same formula as calculate_priority_score, evaluated column-wise
+    impact = df['impact_score'].to_numpy(dtype=float)
+    effort = df['effort_score'].to_numpy(dtype=float)
+    base_score = np.divide(impact, effort, out=np.zeros_like(impact), where=effort != 0)
+
+    strategic_multiplier = _map_multiplier(df, 'strategic_category', STRATEGIC_WEIGHTS)
+    roi_multiplier = _map_multiplier(df, 'roi_estimate', ROI_MULTIPLIERS)
+
+    df['priority_score'] = base_score * strategic_multiplier * roi_multiplier
 
     # Add priority rank
     df['priority_rank'] = df['priority_score'].rank(ascending=False, method='dense').astype(int)
@@ -128,7 +153,16 @@ def add_quadrant_classification(initiatives_df):
         DataFrame: Initiatives with quadrant classification
     """
     df = initiatives_df.copy()
-    df['quadrant'] = df.apply(categorize_quadrant, axis=1)
+
+    # Same thresholds as categorize_quadrant, evaluated column-wise
+    high_impact = df['impact_score'].to_numpy() > 6
+    low_effort = df['effort_score'].to_numpy() <= 5
+
+    df['quadrant'] = np.select(
+        [high_impact & low_effort, high_impact, low_effort],
+        ['Quick Wins', 'Major Projects', 'Fill-ins'],
+        default='Time Sinks'
+    )
     return df
 
 
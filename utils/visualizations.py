@@ -2,12 +2,20 @@
 Visualization Utilities
 
 Reusable Plotly chart functions for sprint analytics dashboard.
+
+Chart builders are cached with st.cache_resource, so repeated calls with the
+same inputs return the same Figure object, shared by every session. Callers
+must not modify it; size a chart by passing height/margin to its builder,
+which applies them before the figure is cached.
+Builders that take a DataFrame cache on just the columns they plot; the rest
+key on their scalar and array arguments.
 """
 
 import plotly.graph_objects as go
 import plotly.express as px
 import pandas as pd
 import numpy as np
+import streamlit as st
 
 
 # Color scheme
@@ -30,21 +38,118 @@ QUADRANT_COLORS = {
     'Time Sinks': COLORS['danger']
 }
 
+# Story type colors
+STORY_TYPE_COLORS = {
+    'Feature': COLORS['primary'],
+    'Bug': COLORS['danger'],
+    'Technical Debt': COLORS['warning'],
+    'Spike': COLORS['neutral']
+}
+
+# Initiative status colors
+INITIATIVE_STATUS_COLORS = {
+    'Completed': COLORS['success'],
+    'Active': COLORS['primary'],
+    'Backlog': COLORS['neutral'],
+    'Deprioritized': COLORS['danger']
+}
+
+# Delivery risk colors (high risk is bad)
+RISK_COLORS = {'Low': COLORS['success'], 'Medium': COLORS['warning'], 'High': COLORS['danger']}
+
+# ROI colors (high ROI is good)
+ROI_COLORS = {'High': COLORS['success'], 'Medium': COLORS['warning'], 'Low': COLORS['danger']}
+
+def _plot_columns(df, columns):
+    """
+    Extract the columns a chart plots as numpy arrays.
+
+    The cached chart builders key on these arrays rather than the caller's full
+    DataFrame, which Streamlit would otherwise hash in full on every rerun.
+    Text columns become fixed-width numpy strings, since object arrays hash by
+    pointer and would never hit the cache. Columns missing from df are skipped.
+    """
+    plot_columns = {}
+    for column in columns:
+        if column in df.columns:
+            values = df[column].to_numpy()
+            plot_columns[column] = values.astype(str) if values.dtype == object else values
+    return plot_columns
+
+
+# Bubble area scaling used for initiative scatter plots (largest bubble diameter in px)
+BUBBLE_SIZE_MAX = 20
+
+
+def _add_bubble_traces(fig, df, x, y, size, color, color_map, hovertemplate, customdata=None,
+                       trace_type=go.Scatter):
+    """
+    Add one bubble scatter trace per color group, in order of first appearance.
+
+    Args:
+        fig: Figure to add traces to
+        df: Source DataFrame
+        x, y, size, color: Column names for position, bubble area and grouping
+        color_map: Group value -> color
+        hovertemplate: Plotly hover template shared by all traces
+        customdata: Optional list of extra columns exposed to the hover template
+        trace_type: Scatter trace class, go.Scattergl to render with WebGL
+    """
+    sizeref = df[size].max() / BUBBLE_SIZE_MAX ** 2
+
+    for group, group_df in df.groupby(color, sort=False):
+        fig.add_trace(trace_type(
+            x=group_df[x].to_numpy(),
+            y=group_df[y].to_numpy(),
+            name=group,
+            legendgroup=group,
+            mode='markers',
+            marker=dict(
+                color=color_map.get(group),
+                size=group_df[size].to_numpy(),
+                sizemode='area',
+                sizeref=sizeref
+            ),
+            hovertext=group_df['name'].to_numpy(),
+            customdata=group_df[customdata].to_numpy() if customdata else None,
+            hovertemplate=hovertemplate
+        ))
+
+
+def _apply_size(fig, height, margin):
+    """Apply a caller's height and margin to a figure before it is cached"""
+    if height is not None:
+        fig.update_layout(height=height)
+    if margin is not None:
+        fig.update_layout(margin=margin)
 
-def create_velocity_trend_chart(sprints_df):
+
+def create_velocity_trend_chart(sprints_df, height=None, margin=None):
     """
     Create velocity trend chart with committed vs completed points.
 
     Args:
         sprints_df: Sprint DataFrame with rolling averages
+        height: Optional figure height in px
+        margin: Optional layout margin dict
 
     Returns:
         plotly Figure
     """
+    return _velocity_trend_chart(_plot_columns(sprints_df, [
+        'sprint_number', 'committed_points',
+        'completed_points', 'velocity_rolling_avg'
+    ]), height=height, margin=margin)
+
+
+@st.cache_resource(max_entries=32, show_spinner=False)
+def _velocity_trend_chart(columns, height=None, margin=None):
+    sprints_df = pd.DataFrame(columns)
+
     fig = go.Figure()
 
     # Committed points
-    fig.add_trace(go.Scatter(
+    fig.add_trace(go.Scattergl(
         x=sprints_df['sprint_number'],
         y=sprints_df['committed_points'],
         name='Committed',
@@ -54,7 +159,7 @@ def create_velocity_trend_chart(sprints_df):
     ))
 
     # Completed points
-    fig.add_trace(go.Scatter(
+    fig.add_trace(go.Scattergl(
         x=sprints_df['sprint_number'],
         y=sprints_df['completed_points'],
         name='Completed',
@@ -65,7 +170,7 @@ def create_velocity_trend_chart(sprints_df):
 
     # 3-sprint moving average
     if 'velocity_rolling_avg' in sprints_df.columns:
-        fig.add_trace(go.Scatter(
+        fig.add_trace(go.Scattergl(
             x=sprints_df['sprint_number'],
             y=sprints_df['velocity_rolling_avg'],
             name='3-Sprint Avg',
@@ -83,10 +188,14 @@ def create_velocity_trend_chart(sprints_df):
         margin=dict(t=10)
     )
 
+    _apply_size(fig, height, margin)
+
     return fig
 
 
-def create_burndown_chart(committed_points, completed_points, days_in_sprint=14, days_elapsed=7):
+@st.cache_resource(max_entries=32, show_spinner=False)
+def create_burndown_chart(committed_points, completed_points, days_in_sprint=14, days_elapsed=7,
+                          height=None, margin=None):
     """
     Create sprint burndown chart.
 
@@ -95,6 +204,8 @@ def create_burndown_chart(committed_points, completed_points, days_in_sprint=14,
         completed_points: Completed story points so far
         days_in_sprint: Total sprint duration (default 14)
         days_elapsed: Days elapsed in sprint (default 7)
+        height: Optional figure height in px
+        margin: Optional layout margin dict
 
     Returns:
         plotly Figure
@@ -153,39 +264,51 @@ def create_burndown_chart(committed_points, completed_points, days_in_sprint=14,
         height=350
     )
 
+    _apply_size(fig, height, margin)
+
     return fig
 
 
-def create_impact_effort_matrix(initiatives_df):
+def create_impact_effort_matrix(initiatives_df, height=None, margin=None):
     """
     Create Impact vs Effort scatter plot (Priority Matrix).
 
     Args:
         initiatives_df: Initiatives DataFrame with quadrant classification
+        height: Optional figure height in px
+        margin: Optional layout margin dict
 
     Returns:
         plotly Figure
     """
-    fig = px.scatter(
-        initiatives_df,
+    return _impact_effort_matrix(_plot_columns(initiatives_df, [
+        'impact_score', 'effort_score', 'total_story_points',
+        'quadrant', 'name', 'status'
+    ]), height=height, margin=margin)
+
+
+@st.cache_resource(max_entries=32, show_spinner=False)
+def _impact_effort_matrix(columns, height=None, margin=None):
+    initiatives_df = pd.DataFrame(columns)
+
+    fig = go.Figure()
+
+    _add_bubble_traces(
+        fig, initiatives_df,
         x='impact_score',
         y='effort_score',
         size='total_story_points',
         color='quadrant',
-        hover_name='name',
-        hover_data={
-            'impact_score': True,
-            'effort_score': True,
-            'total_story_points': True,
-            'status': True,
-            'quadrant': False
-        },
-        color_discrete_map=QUADRANT_COLORS,
-        labels={
-            'impact_score': 'Business Impact Score',
-            'effort_score': 'Effort Score',
-            'total_story_points': 'Story Points'
-        }
+        color_map=QUADRANT_COLORS,
+        hovertemplate=(
+            '<b>%{hovertext}</b><br><br>'
+            'Business Impact Score=%{x}<br>'
+            'Effort Score=%{y}<br>'
+            'Story Points=%{marker.size}<br>'
+            'status=%{customdata[0]}<extra></extra>'
+        ),
+        customdata=['status'],
+        trace_type=go.Scattergl
     )
 
     # Add quadrant dividing lines
@@ -211,19 +334,25 @@ def create_impact_effort_matrix(initiatives_df):
         yaxis=dict(range=[0, 11], title='Effort Required →'),
         height=500,
         showlegend=True,
+        legend=dict(title='quadrant', itemsizing='constant'),
         margin=dict(t=10)
     )
 
+    _apply_size(fig, height, margin)
+
     return fig
 
 
-def create_health_gauge(health_score, title="Sprint Health Score"):
+@st.cache_resource(max_entries=32, show_spinner=False)
+def create_health_gauge(health_score, title="Sprint Health Score", height=None, margin=None):
     """
     Create gauge chart for health scores.
 
     Args:
         health_score: Score from 0-100
         title: Gauge title
+        height: Optional figure height in px
+        margin: Optional layout margin dict
 
     Returns:
         plotly Figure
@@ -259,19 +388,33 @@ def create_health_gauge(health_score, title="Sprint Health Score"):
 
     fig.update_layout(height=250, margin=dict(l=20, r=20, t=50, b=20))
 
+    _apply_size(fig, height, margin)
+
     return fig
 
 
-def create_capacity_heatmap(team_metrics_by_sprint):
+def create_capacity_heatmap(team_metrics_by_sprint, height=None, margin=None):
     """
     Create capacity utilization heatmap for team members across sprints.
 
     Args:
         team_metrics_by_sprint: DataFrame with columns [member_name, sprint_number, utilization_pct]
+        height: Optional figure height in px
+        margin: Optional layout margin dict
 
     Returns:
         plotly Figure
     """
+    return _capacity_heatmap(
+        _plot_columns(team_metrics_by_sprint, ['member_name', 'sprint_number', 'utilization_pct']),
+        height=height, margin=margin
+    )
+
+
+@st.cache_resource(max_entries=32, show_spinner=False)
+def _capacity_heatmap(columns, height=None, margin=None):
+    team_metrics_by_sprint = pd.DataFrame(columns)
+
     # Pivot for heatmap
     pivot_data = team_metrics_by_sprint.pivot(
         index='member_name',
@@ -304,20 +447,34 @@ def create_capacity_heatmap(team_metrics_by_sprint):
         margin=dict(t=10)
     )
 
+    _apply_size(fig, height, margin)
+
     return fig
 
 
-def create_portfolio_quadrant_summary(initiatives_df):
+def create_portfolio_quadrant_summary(initiatives_df, height=None, margin=None):
     """
     Create a simple bar chart showing portfolio composition by quadrant.
     Alternative to the detailed scatter plot for executive summary.
 
     Args:
         initiatives_df: Initiatives DataFrame with quadrant classification
+        height: Optional figure height in px
+        margin: Optional layout margin dict
 
     Returns:
         plotly Figure
     """
+    return _portfolio_quadrant_summary(
+        _plot_columns(initiatives_df, ['quadrant', 'total_story_points']),
+        height=height, margin=margin
+    )
+
+
+@st.cache_resource(max_entries=32, show_spinner=False)
+def _portfolio_quadrant_summary(columns, height=None, margin=None):
+    initiatives_df = pd.DataFrame(columns)
+
     # Count initiatives by quadrant
     quadrant_counts = initiatives_df['quadrant'].value_counts().reset_index()
     quadrant_counts.columns = ['Quadrant', 'Count']
@@ -355,50 +512,80 @@ def create_portfolio_quadrant_summary(initiatives_df):
         margin=dict(t=10)
     )
 
+    _apply_size(fig, height, margin)
+
     return fig
 
 
-def create_cycle_time_boxplot(stories_df):
+def create_cycle_time_boxplot(stories_df, height=None, margin=None):
     """
     Create box plot for cycle time by story point size.
 
     Args:
         stories_df: Stories DataFrame
+        height: Optional figure height in px
+        margin: Optional layout margin dict
 
     Returns:
         plotly Figure
     """
-    fig = px.box(
-        stories_df,
-        x='story_points',
-        y='cycle_time_days',
-        color='story_points',
-        labels={
-            'story_points': 'Story Points',
-            'cycle_time_days': 'Cycle Time (Days)'
-        },
-        title='Cycle Time Distribution by Story Size'
+    return _cycle_time_boxplot(
+        _plot_columns(stories_df, ['story_points', 'cycle_time_days']),
+        height=height, margin=margin
     )
 
+
+@st.cache_resource(max_entries=32, show_spinner=False)
+def _cycle_time_boxplot(columns, height=None, margin=None):
+    stories_df = pd.DataFrame(columns)
+
+    fig = go.Figure()
+
+    # One box per story size, colored from the template colorway
+    for story_points, size_df in stories_df.groupby('story_points', sort=False):
+        fig.add_trace(go.Box(
+            x=size_df['story_points'].to_numpy(),
+            y=size_df['cycle_time_days'].to_numpy(),
+            name=str(story_points),
+            hovertemplate='Story Points=%{x}<br>Cycle Time (Days)=%{y}<extra></extra>'
+        ))
+
     fig.update_layout(
+        title='Cycle Time Distribution by Story Size',
         showlegend=False,
         height=400,
-        xaxis={'type': 'category'}
+        boxmode='overlay',
+        xaxis={'type': 'category', 'title': 'Story Points'},
+        yaxis={'title': 'Cycle Time (Days)'}
     )
 
+    _apply_size(fig, height, margin)
+
     return fig
 
 
-def create_story_type_stacked_area(story_type_by_sprint):
+def create_story_type_stacked_area(story_type_by_sprint, height=None, margin=None):
     """
     Create stacked area chart for story type distribution over time.
 
     Args:
         story_type_by_sprint: DataFrame with columns [sprint_number, story_type, count]
+        height: Optional figure height in px
+        margin: Optional layout margin dict
 
     Returns:
         plotly Figure
     """
+    return _story_type_stacked_area(
+        _plot_columns(story_type_by_sprint, ['sprint_number', 'story_type', 'count']),
+        height=height, margin=margin
+    )
+
+
+@st.cache_resource(max_entries=32, show_spinner=False)
+def _story_type_stacked_area(columns, height=None, margin=None):
+    story_type_by_sprint = pd.DataFrame(columns)
+
     # Pivot data
     pivot_data = story_type_by_sprint.pivot(
         index='sprint_number',
@@ -408,13 +595,6 @@ def create_story_type_stacked_area(story_type_by_sprint):
 
     fig = go.Figure()
 
-    story_type_colors = {
-        'Feature': COLORS['primary'],
-        'Bug': COLORS['danger'],
-        'Technical Debt': COLORS['warning'],
-        'Spike': COLORS['neutral']
-    }
-
     for story_type in pivot_data.columns:
         fig.add_trace(go.Scatter(
             x=pivot_data.index,
@@ -422,7 +602,7 @@ def create_story_type_stacked_area(story_type_by_sprint):
             name=story_type,
             mode='lines',
             stackgroup='one',
-            fillcolor=story_type_colors.get(story_type, COLORS['neutral'])
+            fillcolor=STORY_TYPE_COLORS.get(story_type, COLORS['neutral'])
         ))
 
     fig.update_layout(
@@ -433,15 +613,20 @@ def create_story_type_stacked_area(story_type_by_sprint):
         margin=dict(t=20)
     )
 
+    _apply_size(fig, height, margin)
+
     return fig
 
 
-def create_completion_probability_chart(prediction_data):
+@st.cache_resource(max_entries=32, show_spinner=False)
+def create_completion_probability_chart(prediction_data, height=None, margin=None):
     """
     Create probability distribution chart for sprint completion.
 
     Args:
         prediction_data: Dict from calculate_probability_distribution_chart_data
+        height: Optional figure height in px
+        margin: Optional layout margin dict
 
     Returns:
         plotly Figure
@@ -485,22 +670,34 @@ def create_completion_probability_chart(prediction_data):
         showlegend=False
     )
 
+    _apply_size(fig, height, margin)
+
     return fig
 
 
-def create_initiative_funnel(funnel_data):
+def create_initiative_funnel(funnel_data, height=None, margin=None):
     """
     Create funnel chart for initiative intake process.
 
     Args:
         funnel_data: DataFrame with columns [stage, count, percentage]
+        height: Optional figure height in px
+        margin: Optional layout margin dict
 
     Returns:
         plotly Figure
     """
+    return _initiative_funnel(
+        _plot_columns(funnel_data, ['stage', 'count']),
+        height=height, margin=margin
+    )
+
+
+@st.cache_resource(max_entries=32, show_spinner=False)
+def _initiative_funnel(columns, height=None, margin=None):
     fig = go.Figure(go.Funnel(
-        y=funnel_data['stage'],
-        x=funnel_data['count'],
+        y=columns['stage'],
+        x=columns['count'],
         textinfo="value+percent initial",
         marker=dict(color=[COLORS['neutral'], COLORS['primary'],
                           COLORS['warning'], COLORS['success']])
@@ -511,10 +708,13 @@ def create_initiative_funnel(funnel_data):
         height=400
     )
 
+    _apply_size(fig, height, margin)
+
     return fig
 
 
-def create_treemap(data_df, path_columns, value_column, color_column=None, title="Treemap"):
+def create_treemap(data_df, path_columns, value_column, color_column=None, title="Treemap",
+                   height=None, margin=None):
     """
     Create treemap visualization.
 
@@ -524,12 +724,23 @@ def create_treemap(data_df, path_columns, value_column, color_column=None, title
         value_column: Column name for size
         color_column: Optional column name for color
         title: Chart title
+        height: Optional figure height in px
+        margin: Optional layout margin dict
 
     Returns:
         plotly Figure
     """
+    plotted = list(path_columns) + [value_column] + ([color_column] if color_column else [])
+    return _treemap(
+        _plot_columns(data_df, plotted), list(path_columns), value_column, color_column, title,
+        height=height, margin=margin
+    )
+
+
+@st.cache_resource(max_entries=32, show_spinner=False)
+def _treemap(columns, path_columns, value_column, color_column, title, height=None, margin=None):
     fig = px.treemap(
-        data_df,
+        pd.DataFrame(columns),
         path=path_columns,
         values=value_column,
         color=color_column,
@@ -537,37 +748,341 @@ def create_treemap(data_df, path_columns, value_column, color_column=None, title
         height=500
     )
 
+    _apply_size(fig, height, margin)
+
     return fig
 
 
-def create_roi_scatter(initiatives_df):
+def create_roi_scatter(initiatives_df, height=None, margin=None):
     """
     Create ROI-focused scatter plot.
 
     Args:
         initiatives_df: Initiatives DataFrame
+        height: Optional figure height in px
+        margin: Optional layout margin dict
 
     Returns:
         plotly Figure
     """
-    roi_colors = {'High': COLORS['success'], 'Medium': COLORS['warning'], 'Low': COLORS['danger']}
+    return _roi_scatter(_plot_columns(initiatives_df, [
+        'completed_story_points', 'impact_score',
+        'total_story_points', 'roi_estimate', 'name'
+    ]), height=height, margin=margin)
 
-    fig = px.scatter(
-        initiatives_df,
+
+@st.cache_resource(max_entries=32, show_spinner=False)
+def _roi_scatter(columns, height=None, margin=None):
+    initiatives_df = pd.DataFrame(columns)
+
+    fig = go.Figure()
+
+    _add_bubble_traces(
+        fig, initiatives_df,
         x='completed_story_points',
         y='impact_score',
         size='total_story_points',
         color='roi_estimate',
-        hover_name='name',
-        color_discrete_map=roi_colors,
-        labels={
-            'completed_story_points': 'Investment (Story Points Completed)',
-            'impact_score': 'Business Impact Score',
-            'roi_estimate': 'ROI Category'
-        },
-        title='Initiative ROI Analysis: Investment vs Impact'
+        color_map=ROI_COLORS,
+        hovertemplate=(
+            '<b>%{hovertext}</b><br><br>'
+            'ROI Category=%{customdata[0]}<br>'
+            'Investment (Story Points Completed)=%{x}<br>'
+            'Business Impact Score=%{y}<br>'
+            'total_story_points=%{marker.size}<extra></extra>'
+        ),
+        customdata=['roi_estimate']
+    )
+
+    fig.update_layout(
+        title='Initiative ROI Analysis: Investment vs Impact',
+        xaxis_title='Investment (Story Points Completed)',
+        yaxis_title='Business Impact Score',
+        legend=dict(title='ROI Category', itemsizing='constant'),
+        height=450
+    )
+
+    _apply_size(fig, height, margin)
+
+    return fig
+
+
+def create_count_pie(counts, label, title=None, color_map=None, height=None, margin=None):
+    """
+    Create pie chart from category counts.
+
+    Args:
+        counts: Series of counts indexed by category (e.g. from value_counts)
+        label: Display name for the category
+        title: Optional chart title
+        color_map: Optional dict mapping category -> color
+        height: Optional figure height in px
+        margin: Optional layout margin dict
+
+    Returns:
+        plotly Figure
+    """
+    return _count_pie(
+        counts.index.to_numpy().astype(str), counts.to_numpy(), label, title, color_map,
+        height=height, margin=margin
+    )
+
+
+@st.cache_resource(max_entries=32, show_spinner=False)
+def _count_pie(names, counts, label, title, color_map, height=None, margin=None):
+    fig = go.Figure(go.Pie(
+        labels=names,
+        values=counts,
+        marker=dict(colors=[color_map.get(name, COLORS['neutral']) for name in names]) if color_map else None,
+        hovertemplate=f'{label}=%{{label}}<br>Count=%{{value}}<extra></extra>'
+    ))
+
+    if title:
+        fig.update_layout(title=title)
+    else:
+        fig.update_layout(margin=dict(t=60))
+
+    _apply_size(fig, height, margin)
+
+    return fig
+
+
+def create_initiative_status_bar(status_counts, height=None, margin=None):
+    """
+    Create bar chart of initiative counts by status.
+
+    Args:
+        status_counts: Series of initiative counts indexed by status
+        height: Optional figure height in px
+        margin: Optional layout margin dict
+
+    Returns:
+        plotly Figure
+    """
+    return _initiative_status_bar(
+        status_counts.index.to_numpy().astype(str), status_counts.to_numpy(),
+        height=height, margin=margin
+    )
+
+
+@st.cache_resource(max_entries=32, show_spinner=False)
+def _initiative_status_bar(statuses, counts, height=None, margin=None):
+    fig = go.Figure(go.Bar(
+        x=statuses,
+        y=counts,
+        marker_color=[INITIATIVE_STATUS_COLORS.get(status, COLORS['neutral']) for status in statuses],
+        hovertemplate='Status=%{x}<br>Count=%{y}<extra></extra>'
+    ))
+
+    fig.update_layout(
+        xaxis_title='Status',
+        yaxis_title='Count',
+        showlegend=False,
+        margin=dict(t=60)
+    )
+
+    _apply_size(fig, height, margin)
+
+    return fig
+
+
+def create_portfolio_composition_bar(composition, height=None, margin=None):
+    """
+    Create bar chart of initiative counts per portfolio quadrant.
+
+    Args:
+        composition: DataFrame with columns [quadrant, initiative_count]
+        height: Optional figure height in px
+        margin: Optional layout margin dict
+
+    Returns:
+        plotly Figure
+    """
+    return _portfolio_composition_bar(
+        _plot_columns(composition, ['quadrant', 'initiative_count']),
+        height=height, margin=margin
+    )
+
+
+@st.cache_resource(max_entries=32, show_spinner=False)
+def _portfolio_composition_bar(columns, height=None, margin=None):
+    composition = pd.DataFrame(columns)
+
+    fig = go.Figure(go.Bar(
+        x=composition['quadrant'],
+        y=composition['initiative_count'],
+        marker_color=[QUADRANT_COLORS.get(q, COLORS['neutral']) for q in composition['quadrant']],
+        text=composition['initiative_count'],
+        textposition='outside',
+        hovertemplate='Quadrant=%{x}<br>Count=%{y}<extra></extra>'
+    ))
+
+    fig.update_layout(
+        xaxis_title='Quadrant',
+        yaxis_title='Count',
+        showlegend=False,
+        margin=dict(t=60)
+    )
+
+    _apply_size(fig, height, margin)
+
+    return fig
+
+
+def create_velocity_contribution_bar(velocity_contrib, height=None, margin=None):
+    """
+    Create horizontal bar chart of story points delivered per team member.
+
+    Args:
+        velocity_contrib: DataFrame with columns [name, points_delivered]
+        height: Optional figure height in px
+        margin: Optional layout margin dict
+
+    Returns:
+        plotly Figure
+    """
+    return _velocity_contribution_bar(
+        _plot_columns(velocity_contrib, ['name', 'points_delivered']),
+        height=height, margin=margin
+    )
+
+
+@st.cache_resource(max_entries=32, show_spinner=False)
+def _velocity_contribution_bar(columns, height=None, margin=None):
+    velocity_contrib = pd.DataFrame(columns)
+
+    fig = go.Figure(go.Bar(
+        x=velocity_contrib['points_delivered'],
+        y=velocity_contrib['name'],
+        orientation='h',
+        marker=dict(
+            color=velocity_contrib['points_delivered'],
+            colorscale='Blues',
+            showscale=True,
+            colorbar=dict(title='Story Points Delivered')
+        ),
+        text=velocity_contrib['points_delivered'],
+        textposition='outside',
+        hovertemplate='Story Points Delivered=%{x}<br>Team Member=%{y}<extra></extra>'
+    ))
+
+    fig.update_layout(
+        xaxis_title='Story Points Delivered',
+        yaxis_title='Team Member',
+        showlegend=False,
+        margin=dict(t=60)
+    )
+
+    _apply_size(fig, height, margin)
+
+    return fig
+
+
+def create_velocity_stability_chart(sprints_df, height=None, margin=None):
+    """
+    Create line chart of sprint velocity with its rolling average.
+
+    Args:
+        sprints_df: Sprint DataFrame with rolling averages
+        height: Optional figure height in px
+        margin: Optional layout margin dict
+
+    Returns:
+        plotly Figure
+    """
+    return _velocity_stability_chart(_plot_columns(sprints_df, [
+        'sprint_number', 'velocity', 'velocity_rolling_avg'
+    ]), height=height, margin=margin)
+
+
+@st.cache_resource(max_entries=32, show_spinner=False)
+def _velocity_stability_chart(columns, height=None, margin=None):
+    sprints_df = pd.DataFrame(columns)
+
+    fig = go.Figure()
+
+    fig.add_trace(go.Scattergl(
+        x=sprints_df['sprint_number'],
+        y=sprints_df['velocity'],
+        name='Velocity',
+        mode='lines+markers',
+        line=dict(color=COLORS['primary'], width=3)
+    ))
+
+    if 'velocity_rolling_avg' in sprints_df.columns:
+        fig.add_trace(go.Scattergl(
+            x=sprints_df['sprint_number'],
+            y=sprints_df['velocity_rolling_avg'],
+            name='3-Sprint Avg',
+            mode='lines',
+            line=dict(color=COLORS['warning'], width=2, dash='dash')
+        ))
+
+    fig.update_layout(
+        title='Velocity Stability Over Time',
+        xaxis_title='Sprint Number',
+        yaxis_title='Story Points'
+    )
+
+    _apply_size(fig, height, margin)
+
+    return fig
+
+
+def create_velocity_forecast_chart(sprints_df, future_sprints, forecast, height=None, margin=None):
+    """
+    Create chart of historical velocity followed by forecast sprints.
+
+    Both series are built into one figure, so the forecast chart is only
+    rebuilt when the sprint data or the forecast itself changes.
+
+    Args:
+        sprints_df: Sprint DataFrame
+        future_sprints: Sprint numbers being forecast
+        forecast: Forecast velocity for each future sprint
+        height: Optional figure height in px
+        margin: Optional layout margin dict
+
+    Returns:
+        plotly Figure
+    """
+    return _velocity_forecast_chart(
+        _plot_columns(sprints_df, ['sprint_number', 'velocity']),
+        tuple(future_sprints),
+        tuple(forecast),
+        height=height,
+        margin=margin
+    )
+
+
+@st.cache_resource(max_entries=32, show_spinner=False)
+def _velocity_forecast_chart(columns, future_sprints, forecast, height=None, margin=None):
+    sprints_df = pd.DataFrame(columns)
+
+    fig = go.Figure()
+
+    fig.add_trace(go.Scattergl(
+        x=sprints_df['sprint_number'],
+        y=sprints_df['velocity'],
+        name='Historical',
+        mode='lines+markers',
+        line=dict(color=COLORS['primary'], width=2)
+    ))
+
+    fig.add_trace(go.Scattergl(
+        x=list(future_sprints),
+        y=list(forecast),
+        name='Forecast',
+        mode='lines+markers',
+        line=dict(color=COLORS['warning'], width=2, dash='dash')
+    ))
+
+    fig.update_layout(
+        title='Velocity Forecast (Next 3 Sprints)',
+        xaxis_title='Sprint Number',
+        yaxis_title='Story Points'
     )
 
-    fig.update_layout(height=450)
+    _apply_size(fig, height, margin)
 
     return fig